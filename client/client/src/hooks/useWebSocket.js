@@ -228,6 +228,7 @@ export default function useWebSocket() {
           const msg = JSON.parse(event.data)
           if (msg.type === "news") handleNews(msg.data)
           else if (msg.type === "decision") handleDecision(msg.data)
+          else if (msg.type === "decisions") msg.data.forEach(handleDecision)
           else if (msg.type === "price_update") {
             // Handle real-time price updates from Kalshi
             const { ticker, price, prev_price } = msg.data
@@ -237,6 +238,15 @@ export default function useWebSocket() {
                 : market
             ))
           }
+          else if (msg.type === "price_batch") {
+            // Coalesced Kalshi ticks — one state update for the whole batch
+            const prices = new Map(msg.data.map(t => [t.ticker, t.price]))
+            setMarkets(prev => prev.map(market =>
+              prices.has(market.address)
+                ? { ...market, current_probability: prices.get(market.address) }
+                : market
+            ))
+          }
           else if (msg.type === "connected" && msg.markets_state) {
             setMarkets(msg.markets_state.markets || [])
             setEnabledMarkets(new Set(msg.markets_state.enabled || []))
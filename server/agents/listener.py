@@ -8,6 +8,7 @@ a story arrives. One listener per market — no centralised dispatcher.
 from __future__ import annotations
 
 import asyncio
+import functools
 import logging
 from dataclasses import dataclass
 from datetime import datetime
@@ -16,6 +17,7 @@ from typing import Any, Awaitable, Callable
 from pub_sub_feed import FeedSubscriber
 from news_streamer.pubsub.channels import ALL, CATEGORY_PREFIX
 
+from agents.modal_handle import get_modal_agent
 from agents.schemas import Decision, MarketConfig, StoryPayload
 
 logger = logging.getLogger(__name__)
@@ -48,6 +50,8 @@ class AgentListener:
     calls Modal on every matching story.
 
     One instance per market. The runner spawns all of them as concurrent tasks.
+    Pass a pre-resolved Modal `agent` handle to share it across listeners
+    (e.g. the one used for warm-up) instead of resolving the class per call.
     """
 
     def __init__(
@@ -58,10 +62,17 @@ class AgentListener:
             [StoryPayload, MarketConfig], Awaitable[Decision]
         ] | None = None,
         on_decision: Callable[[dict[str, Any]], Awaitable[None]] | None = None,
+        agent: Any | None = None,
     ) -> None:
         self._market = market
         self._redis_url = redis_url
-        self._evaluate_fn = evaluate_fn or _modal_evaluate
+        if evaluate_fn is None:
+            evaluate_fn = (
+                functools.partial(_modal_evaluate, agent=agent)
+                if agent is not None
+                else _modal_evaluate
+            )
+        self._evaluate_fn = evaluate_fn
         self._on_decision = on_decision
         self._stats = ListenerStats()
 
@@ -149,14 +160,14 @@ class AgentListener:
                 logger.warning(f"on_decision callback failed: {e}")
 
 
-async def _modal_evaluate(story: StoryPayload, market: MarketConfig) -> Decision:
+async def _modal_evaluate(
+    story: StoryPayload, market: MarketConfig, agent: Any | None = None
+) -> Decision:
     """
     Default evaluate_fn: calls the deployed MarketAgent (Groq) on Modal.
     """
-    import modal
-
-    Cls = modal.Cls.from_name("trademaxxer-agents", "MarketAgent")
-    agent = Cls()
+    if agent is None:
+        agent = get_modal_agent()
 
     result = await agent.evaluate.remote.aio(story.to_dict(), market.to_dict())
     return Decision.from_dict(result)
@@ -169,14 +180,18 @@ async def run_all_listeners(
         [StoryPayload, MarketConfig], Awaitable[Decision]
     ] | None = None,
     on_decision: Callable[[dict[str, Any]], Awaitable[None]] | None = None,
+    agent: Any | None = None,
 ) -> list[asyncio.Task]:
     """
     Spawn one AgentListener per market as concurrent tasks.
 
+    All listeners share one Modal `agent` handle — the one passed in, or
+    the process-wide get_modal_agent() instance.
+
     Returns the list of asyncio Tasks so the caller can cancel them on shutdown.
     """
     listeners = [
-        AgentListener(market, redis_url, evaluate_fn, on_decision)
+        AgentListener(market, redis_url, evaluate_fn, on_decision, agent)
         for market in markets
     ]
 
@@ -0,0 +1,34 @@
+"""
+Modal Agent Handle
+
+Process-wide handle to the deployed MarketAgent class. `Cls.from_name` is a
+metadata round-trip to Modal's control plane, so it is resolved once here and
+shared by the orchestrator (warm-up + evals) and every AgentListener.
+
+Usage:
+    from agents.modal_handle import get_modal_agent
+
+    agent = get_modal_agent()
+    result = await agent.evaluate.remote.aio(story_dict, market_dict)
+"""
+from __future__ import annotations
+
+from typing import Any
+
+APP_NAME = "trademaxxer-agents"
+CLS_NAME = "MarketAgent"
+
+_AGENT_CLS: Any = None
+_AGENT_INSTANCE: Any = None
+
+
+def get_modal_agent() -> Any:
+    """Return the shared MarketAgent instance, resolving it on first call."""
+    global _AGENT_CLS, _AGENT_INSTANCE
+    if _AGENT_INSTANCE is None:
+        if _AGENT_CLS is None:
+            import modal
+
+            _AGENT_CLS = modal.Cls.from_name(APP_NAME, CLS_NAME)
+        _AGENT_INSTANCE = _AGENT_CLS()
+    return _AGENT_INSTANCE
@@ -2,12 +2,13 @@
 Agent Pipeline Data Models
 
 Schemas for data flowing between the dispatcher, Modal agents, and decision queue.
-All models use frozen dataclasses with __post_init__ validation.
+All models use frozen dataclasses with __post_init__ validation, except
+MarketConfig, whose current_probability is updated in place by the live feed.
 """
 from __future__ import annotations
 
-from dataclasses import dataclass, asdict
-from datetime import datetime
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
 from typing import Any, Literal
 
 
@@ -15,13 +16,16 @@ from typing import Any, Literal
 # Market configuration — one per on-chain prediction market
 # ---------------------------------------------------------------------------
 
-@dataclass(frozen=True)
+@dataclass(slots=True)
 class MarketConfig:
     """
     Describes a single prediction market that an agent evaluates against.
 
     The agent receives this alongside a news story and decides whether the
     news supports YES, NO, or is irrelevant (SKIP) for the market question.
+
+    Slotted (no per-instance __dict__) and mutable: live price ticks assign
+    current_probability directly. Validation only runs at construction.
     """
 
     address: str
@@ -44,12 +48,15 @@ class MarketConfig:
             raise ValueError("tags must contain at least one tag")
 
     def to_dict(self) -> dict[str, Any]:
-        d = asdict(self)
-        if self.expires_at is not None:
-            d["expires_at"] = self.expires_at.isoformat()
-        else:
-            d["expires_at"] = None
-        return d
+        # Built field by field: asdict() deep-copies every value on each call
+        return {
+            "address": self.address,
+            "question": self.question,
+            "current_probability": self.current_probability,
+            "tags": self.tags,
+            "expires_at": self.expires_at.isoformat() if self.expires_at is not None else None,
+            "rules_primary": self.rules_primary,
+        }
 
     @classmethod
     def from_dict(cls, d: dict[str, Any]) -> MarketConfig:
@@ -66,6 +73,9 @@ class MarketConfig:
         )
 
 
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
 # ---------------------------------------------------------------------------
 # Story payload — slimmed-down news item sent to Modal agents
 # ---------------------------------------------------------------------------
@@ -77,6 +87,10 @@ class StoryPayload:
 
     Stripped from TaggedNewsItem to only the fields the agent needs,
     keeping the Modal function's input small and serializable.
+
+    `timestamp` is integer nanoseconds since the Unix epoch (time.time_ns()),
+    so the hot path never builds a datetime. A timezone-aware datetime is
+    also accepted and converted; use `as_datetime` when one is needed.
     """
 
     id: str
@@ -84,19 +98,46 @@ class StoryPayload:
     body: str
     tags: tuple[str, ...]
     source: str
-    timestamp: datetime
+    timestamp: int
 
     def __post_init__(self) -> None:
         if not self.id:
             raise ValueError("id must be non-empty")
         if not self.headline:
             raise ValueError("headline must be non-empty")
-        if self.timestamp.tzinfo is None:
-            raise ValueError("timestamp must be timezone-aware")
+        if isinstance(self.timestamp, datetime):
+            if self.timestamp.tzinfo is None:
+                raise ValueError("timestamp must be timezone-aware")
+            ns = (self.timestamp - _EPOCH) // timedelta(microseconds=1) * 1000
+            object.__setattr__(self, "timestamp", ns)
+
+    @property
+    def as_datetime(self) -> datetime:
+        """The timestamp as a UTC datetime, built on demand."""
+        return _EPOCH + timedelta(microseconds=self.timestamp // 1000)
 
     def to_dict(self) -> dict[str, Any]:
-        d = asdict(self)
-        d["timestamp"] = self.timestamp.isoformat()
+        # Wire format stays ISO-8601 for deployed agents
+        return {
+            "id": self.id,
+            "headline": self.headline,
+            "body": self.body,
+            "tags": self.tags,
+            "source": self.source,
+            "timestamp": self.as_datetime.isoformat(),
+        }
+
+    def to_dict_cached(self) -> dict[str, Any]:
+        """
+        to_dict() memoized on the instance.
+
+        One story fans out to every matching market, so the dict is built
+        once and shared. Callers must treat it as read-only.
+        """
+        d = self.__dict__.get("_dict_cache")
+        if d is None:
+            d = self.to_dict()
+            object.__setattr__(self, "_dict_cache", d)
         return d
 
     @classmethod
@@ -153,7 +194,16 @@ class Decision:
             raise ValueError(f"theo must be in [0.0, 1.0], got {self.theo}")
 
     def to_dict(self) -> dict[str, Any]:
-        return asdict(self)
+        return {
+            "action": self.action,
+            "confidence": self.confidence,
+            "reasoning": self.reasoning,
+            "market_address": self.market_address,
+            "story_id": self.story_id,
+            "latency_ms": self.latency_ms,
+            "prompt_version": self.prompt_version,
+            "theo": self.theo,
+        }
 
     @classmethod
     def from_dict(cls, d: dict[str, Any]) -> Decision:
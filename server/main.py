@@ -18,11 +18,16 @@ from __future__ import annotations
 
 import argparse
 import asyncio
+import atexit
+import importlib
 import logging
+import logging.handlers
 import os
+import queue
 import signal
 import time
-from datetime import datetime, timezone
+
+import orjson
 
 try:
     from dotenv import load_dotenv
@@ -30,14 +35,40 @@ try:
 except ImportError:
     pass
 
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s [%(name)s] %(levelname)s — %(message)s",
+# Records are only enqueued on the event loop; a listener thread does the
+# final formatting and the blocking stream write.
+_log_queue: queue.SimpleQueue = queue.SimpleQueue()
+_log_handler = logging.StreamHandler()
+_log_handler.setFormatter(
+    logging.Formatter("%(asctime)s [%(name)s] %(levelname)s — %(message)s")
 )
+_log_listener = logging.handlers.QueueListener(_log_queue, _log_handler)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+_queue_handler = logging.handlers.QueueHandler(_log_queue)
+_queue_handler.setFormatter(logging.Formatter("%(message)s"))  # args merge only
+logging.basicConfig(level=logging.INFO, handlers=[_queue_handler])
 logger = logging.getLogger("trademaxxer")
 
+# Max in-flight Modal RPCs; HOT stories can match dozens of markets at once
+MODAL_MAX_CONCURRENCY = int(os.environ.get("MODAL_MAX_CONCURRENCY", "16"))
+# Per-step teardown bounds (seconds) so a hung RPC or socket can't block exit
+TASK_SHUTDOWN_TIMEOUT = 5.0
+SERVICE_SHUTDOWN_TIMEOUT = 3.0
+# Max stories being evaluated at once; past this, new stories skip evaluation
+MAX_INFLIGHT_STORIES = int(os.environ.get("MAX_INFLIGHT_STORIES", "32"))
+# Concurrent dummy evals at startup, so that many replicas boot before news lands
+MODAL_WARM_REPLICAS = int(os.environ.get("MODAL_WARM_REPLICAS", "4"))
+# Seconds between keep-warm pings; must stay under Modal's container idle timeout
+WARM_INTERVAL = float(os.environ.get("MODAL_WARM_INTERVAL", "240"))
+
 _groq_client = None
-_modal_agent = None
+_modal_eval = None
+
+
+def _encode(payload: dict) -> bytes:
+    """Serialize a broadcast frame once; the bytes are reused for every client."""
+    return orjson.dumps(payload)
 
 
 def _get_groq_client():
@@ -54,14 +85,13 @@ def _get_groq_client():
     return _groq_client
 
 
-def _get_modal_agent():
-    """Lazy-init the Modal MarketAgent handle (singleton)."""
-    global _modal_agent
-    if _modal_agent is None:
-        import modal
-        Cls = modal.Cls.from_name("trademaxxer-agents", "MarketAgent")
-        _modal_agent = Cls()
-    return _modal_agent
+def _get_modal_eval():
+    """Bound `evaluate.remote.aio` of the Modal agent, resolved once (singleton)."""
+    global _modal_eval
+    if _modal_eval is None:
+        from agents.modal_handle import get_modal_agent
+        _modal_eval = get_modal_agent().evaluate.remote.aio
+    return _modal_eval
 
 
 async def run(*, use_mock: bool = False, use_local: bool = False) -> None:
@@ -71,16 +101,60 @@ async def run(*, use_mock: bool = False, use_local: bool = False) -> None:
     for sig in (signal.SIGINT, signal.SIGTERM):
         loop.add_signal_handler(sig, shutdown_event.set)
 
+    # ── Preload market/feed modules in worker threads ──────────────
+    # Overlaps their import time with news-streamer setup; the `from ...`
+    # imports below then hit sys.modules. Failures resurface there.
+    preload = ["news_streamer.tagger", "market_registry.kalshi", "demo_markets"]
+    preload.append("mock_feed" if use_mock else "market_registry.kalshi_ws")
+    preload_task = asyncio.gather(
+        *[asyncio.to_thread(importlib.import_module, name) for name in preload],
+        return_exceptions=True,
+    )
+
     # ── News Streamer ──────────────────────────────────────────────
     from news_streamer.config import settings
-    from news_streamer.tagger import NewsTagger
     from news_streamer.ws_server import NewsWebSocketServer
 
     ws_server = NewsWebSocketServer(
         host=settings.websocket_server.host,
         port=settings.websocket_server.port,
     )
-    tagger = NewsTagger(settings.tagger, platform_tag_loader=None)
+    # Bind before the slow part of startup (tagger import, Kalshi fetch,
+    # warm-up) so early clients connect instead of being refused; they get
+    # the markets_state frame once the market list is ready.
+    await ws_server.start()
+    logger.info(
+        f"WebSocket server listening on "
+        f"ws://{settings.websocket_server.host}:{settings.websocket_server.port}"
+    )
+
+    # ── Broadcast queue (one long-lived sender, bounded) ───────────
+    broadcast_q: asyncio.Queue = asyncio.Queue(maxsize=1000)
+    broadcasters = {
+        "news": ws_server.broadcast,
+        "json": ws_server.broadcast_json,
+    }
+    broadcast_dropped = 0
+
+    def _enqueue_broadcast(kind: str, *args) -> None:
+        """Queue a broadcast without awaiting; drops the oldest frame when full."""
+        nonlocal broadcast_dropped
+        try:
+            broadcast_q.put_nowait((kind, args))
+        except asyncio.QueueFull:
+            broadcast_q.get_nowait()
+            broadcast_q.put_nowait((kind, args))
+            broadcast_dropped += 1
+            if broadcast_dropped % 100 == 1:
+                logger.warning("Broadcast queue full — dropped %d frame(s) so far", broadcast_dropped)
+
+    async def _broadcast_worker() -> None:
+        while True:
+            kind, args = await broadcast_q.get()
+            try:
+                await broadcasters[kind](*args)
+            except Exception as e:
+                logger.warning("Broadcast failed (%s): %s", kind, e)
 
     dbnews_client = None
     if not use_mock:
@@ -93,6 +167,10 @@ async def run(*, use_mock: bool = False, use_local: bool = False) -> None:
         dbnews_client = DBNewsWebSocketClient(settings.dbnews.ws_url)
 
     # ── Markets ────────────────────────────────────────────────────
+    await preload_task
+    from news_streamer.tagger import NewsTagger
+    tagger = NewsTagger(settings.tagger, platform_tag_loader=None)
+
     from agents.schemas import MarketConfig, StoryPayload
     from market_registry.kalshi import KalshiMarketRegistry
 
@@ -118,7 +196,8 @@ async def run(*, use_mock: bool = False, use_local: bool = False) -> None:
                 private_key = os.environ.get("KALSHI_PRIVATE_KEY")
 
                 if api_key and private_key:
-                    live_market_manager = LiveMarketManager(api_key, private_key)
+                    # _tick_flusher already coalesces per ticker; don't add a second window
+                    live_market_manager = LiveMarketManager(api_key, private_key, flush_interval=None)
                     await live_market_manager.__aenter__()
                     logger.info("Initialized Kalshi WebSocket for live price updates")
                 else:
@@ -132,49 +211,100 @@ async def run(*, use_mock: bool = False, use_local: bool = False) -> None:
 
     # ── Demo contracts (prepend, all off by default) ─────────────
     from demo_markets import DEMO_CONTRACTS
-    demo_addrs = {m.address for m in DEMO_CONTRACTS}
-    markets = list(DEMO_CONTRACTS) + [m for m in markets if m.address not in demo_addrs]
+    demo_addrs = frozenset(m.address for m in DEMO_CONTRACTS)
+    # Live Kalshi markets only — demo contracts have no real tickers
+    real_markets = [m for m in markets if m.address not in demo_addrs]
+    markets = list(DEMO_CONTRACTS) + real_markets
     logger.info(f"Injected {len(DEMO_CONTRACTS)} demo contracts (all off)")
 
     market_by_addr = {m.address: m for m in markets}
+    # Serialized once for Modal RPCs; only current_probability changes live
+    market_dicts: dict[str, dict] = {m.address: m.to_dict() for m in markets}
+    # Same dict objects in `markets` order; price ticks update them in place
+    market_dict_list = list(market_dicts.values())
+    # Log-line prefixes, sliced once at startup instead of per decision
+    short_addrs: dict[str, str] = {m.address: m.address[:8] for m in markets}
 
     # ── Market state (all OFF by default) ──────────────────────────
     enabled_markets: set[str] = set()
+    warmed_markets: set[str] = set()  # addresses already sent a Modal warm-up eval
+    last_real_eval: dict[str, float] = {}  # address → loop.time() of last real Modal eval
 
     # ── In-memory pub/sub: tag channels → market eval callbacks ───
     from pubsub import PubSub
     bus = PubSub()
     market_callbacks: dict[str, object] = {}  # address → callback ref for unsubscribe
 
+    # Snapshot is rebuilt lazily: toggles and flushed price ticks only clear it
+    markets_state: dict | None = None
+    markets_state_frame: bytes | None = None
+
+    def _invalidate_markets_state() -> None:
+        nonlocal markets_state, markets_state_frame
+        markets_state = None
+        markets_state_frame = None
+
     def _markets_state_payload() -> dict:
-        payload = {
-            "markets": [m.to_dict() for m in markets],
-            "enabled": list(enabled_markets),
-        }
-        logger.info(f"Markets state payload: {len(payload['markets'])} markets, {len(payload['enabled'])} enabled")
-        return payload
+        nonlocal markets_state
+        if markets_state is None:
+            markets_state = {
+                "markets": market_dict_list,
+                "enabled": list(enabled_markets),
+            }
+            logger.info(
+                "Markets state payload: %d markets, %d enabled",
+                len(markets_state["markets"]), len(markets_state["enabled"]),
+            )
+        return markets_state
+
+    def _markets_state_frame() -> bytes:
+        nonlocal markets_state_frame
+        if markets_state_frame is None:
+            markets_state_frame = _encode({"type": "markets_state", "data": _markets_state_payload()})
+        return markets_state_frame
 
     # ── Live price updates ─────────────────────────────────────────
-    async def _handle_price_update(ticker: str, price: float) -> None:
-        """Handle real-time price updates from Kalshi WebSocket."""
+    # Ticks are coalesced per ticker and flushed as one frame every 50ms,
+    # so a burst across many tickers costs each client a single write.
+    pending_ticks: dict[str, dict] = {}
+
+    def _handle_price_update(ticker: str, price: float) -> None:
+        """Handle real-time price updates from Kalshi WebSocket (sync, no awaits)."""
         # Update the market in our local state
         market = market_by_addr.get(ticker)
         if market:
             old_price = market.current_probability
+            if price == old_price:
+                # Book churn that leaves the mid unchanged: nothing to cache or send
+                return
             market.current_probability = price
+            market_dicts[ticker]["current_probability"] = price
+
+            # Last write wins; keep the first prev_price seen in this window
+            prev = pending_ticks.get(ticker)
+            pending_ticks[ticker] = {
+                "ticker": ticker,
+                "price": price,
+                "prev_price": prev["prev_price"] if prev else old_price,
+                "timestamp": time.time(),
+            }
 
-            # Broadcast price update to connected clients
-            await ws_server.broadcast_json({
-                "type": "price_update",
-                "data": {
-                    "ticker": ticker,
-                    "price": price,
-                    "prev_price": old_price,
-                    "timestamp": time.time()
-                }
-            })
+            logger.debug("Price update %s: %.3f → %.3f", ticker, old_price, price)
 
-            logger.debug(f"Price update {ticker}: {old_price:.3f} → {price:.3f}")
+    async def _tick_flusher() -> None:
+        while True:
+            await asyncio.sleep(0.05)
+            if not pending_ticks:
+                continue
+            try:
+                if ws_server.client_count:
+                    ws_server.broadcast_bytes(
+                        _encode({"type": "price_batch", "data": list(pending_ticks.values())})
+                    )
+            except Exception as e:
+                logger.warning("Price batch broadcast failed: %s", e)
+            pending_ticks.clear()
+            _invalidate_markets_state()
 
     if live_market_manager:
         live_market_manager.on_price_update(_handle_price_update)
@@ -182,74 +312,143 @@ async def run(*, use_mock: bool = False, use_local: bool = False) -> None:
     async def _handle_command(data: dict) -> None:
         address = data.get("address", "")
         want_enabled = data.get("enabled", True)
-        if address not in market_by_addr:
+        market = market_by_addr.get(address)  # one O(1) lookup per command
+        if market is None:
             return
 
         if want_enabled and address not in enabled_markets:
             enabled_markets.add(address)
-            _subscribe_market(market_by_addr[address])
-            logger.info(f"Market enabled: {address[:16]}… (bus: {bus.channel_count}ch, {bus.subscriber_count} subs)")
+            _subscribe_market(market)
+            _invalidate_markets_state()
+            if not use_local and not use_mock and address not in warmed_markets:
+                task = asyncio.create_task(_warmup_modal([market]))
+                warm_tasks.add(task)
+                task.add_done_callback(warm_tasks.discard)
+            logger.info(
+                "Market enabled: %s… (bus: %dch, %d subs)",
+                address[:16], bus.channel_count, bus.subscriber_count,
+            )
         elif not want_enabled and address in enabled_markets:
             enabled_markets.discard(address)
-            _unsubscribe_market(market_by_addr[address])
-            logger.info(f"Market disabled: {address[:16]}… (bus: {bus.channel_count}ch, {bus.subscriber_count} subs)")
+            _unsubscribe_market(market)
+            _invalidate_markets_state()
+            logger.info(
+                "Market disabled: %s… (bus: %dch, %d subs)",
+                address[:16], bus.channel_count, bus.subscriber_count,
+            )
 
+        # Welcome frame updates now; the broadcast is coalesced
         ws_server.set_welcome_extra({"markets_state": _markets_state_payload()})
-        await ws_server.broadcast_json({
-            "type": "markets_state",
-            "data": _markets_state_payload(),
-        })
+        _schedule_markets_state_flush()
+
+    markets_state_flush: asyncio.Task | None = None
+
+    def _schedule_markets_state_flush() -> None:
+        """Broadcast markets_state within 50ms; toggles inside the window share one send."""
+        nonlocal markets_state_flush
+        if markets_state_flush is None or markets_state_flush.done():
+            markets_state_flush = asyncio.create_task(_flush_markets_state())
+
+    async def _flush_markets_state() -> None:
+        await asyncio.sleep(0.05)
+        if not ws_server.client_count:  # no one to send to: skip the encode
+            return
+        try:
+            ws_server.broadcast_bytes(_markets_state_frame())
+        except Exception as e:
+            logger.warning("markets_state broadcast failed: %s", e)
 
     ws_server.set_command_handler(_handle_command)
 
     # ── Per-market eval callback (created once per market) ─────────
+    # Resolve the evaluator once here rather than on every (story, market) call
+    if use_mock and not use_local:
+        from mock_feed import mock_evaluate_batch
+    elif use_local:
+        from agents.agent_logic import evaluate as groq_evaluate
+    modal_sem = asyncio.Semaphore(MODAL_MAX_CONCURRENCY)
+
+    # Mock mode: market callbacks only collect into the story's batch, which
+    # _mock_dispatch evaluates in one call and broadcasts as one frame.
+    mock_batches: dict[int, list[MarketConfig]] = {}  # id(story) → matched markets
+
+    def _finish_result(
+        result: dict, story: StoryPayload, market: MarketConfig, eval_ms: float,
+    ) -> dict:
+        result["headline"] = story.headline
+        result["market_question"] = market.question
+        result["prev_price"] = market.current_probability
+
+        action = result.get("action", "SKIP")
+        if action != "SKIP" and logger.isEnabledFor(logging.INFO):
+            theo = result.get("theo")
+            theo_str = f" theo={theo:.0%}" if theo is not None else ""
+            logger.info("[%s] %s…%s %.0fms", action, short_addrs[market.address], theo_str, eval_ms)
+        return result
 
     def _make_market_callback(market: MarketConfig):
         """Build an async callback bound to a single market for the bus."""
+        short_addr = short_addrs[market.address]
+
+        if use_mock and not use_local:
+            async def _collect(story: StoryPayload) -> None:
+                mock_batches[id(story)].append(market)
+
+            return _collect
+
         async def _on_story(story: StoryPayload) -> None:
-            t0 = time.monotonic()
+            t0 = loop.time()
 
-            if use_mock and not use_local:
-                from mock_feed import mock_evaluate
-                try:
-                    decision = await mock_evaluate(story, market)
-                except Exception as e:
-                    logger.error(f"Mock eval failed: {e}")
-                    return
-                result = decision.to_dict()
-            elif use_local:
-                from agents.agent_logic import evaluate as groq_evaluate
+            if use_local:
                 groq = _get_groq_client()
                 try:
                     decision = await groq_evaluate(story, market, groq)
                     result = decision.to_dict()
                 except Exception as e:
-                    logger.warning(f"Groq eval failed for {market.address[:8]}…: {e}")
+                    logger.warning("Groq eval failed for %s…: %s", short_addr, e)
                     return
             else:
-                agent = _get_modal_agent()
+                modal_eval = _get_modal_eval()
+                last_real_eval[market.address] = t0
                 try:
-                    result = await agent.evaluate.remote.aio(
-                        story.to_dict(), market.to_dict(),
-                    )
+                    async with modal_sem:
+                        result = await modal_eval(
+                            story.to_dict_cached(), market_dicts[market.address],
+                        )
                 except Exception as e:
-                    logger.warning(f"Modal eval failed for {market.address[:8]}…: {e}")
+                    logger.warning("Modal eval failed for %s…: %s", short_addr, e)
                     return
 
-            eval_ms = (time.monotonic() - t0) * 1000
-            result["headline"] = story.headline
-            result["market_question"] = market.question
-            result["prev_price"] = market.current_probability
+            eval_ms = (loop.time() - t0) * 1000
+            result = _finish_result(result, story, market, eval_ms)
+            if ws_server.client_count:
+                ws_server.broadcast_bytes(_encode({"type": "decision", "data": result}))
 
-            action = result.get("action", "SKIP")
-            if action != "SKIP":
-                theo = result.get("theo")
-                theo_str = f" theo={theo:.0%}" if theo is not None else ""
-                logger.info(f"[{action}] {market.address[:8]}…{theo_str} {eval_ms:.0f}ms")
+        return _on_story
 
-            asyncio.create_task(ws_server.broadcast_decision(result))
+    async def _mock_dispatch(tags: tuple[str, ...], story: StoryPayload) -> None:
+        batch = mock_batches[id(story)] = []
+        try:
+            await bus.publish(tags, story)
+        finally:
+            del mock_batches[id(story)]
+        if not batch:
+            return
 
-        return _on_story
+        t0 = loop.time()
+        try:
+            decisions = await mock_evaluate_batch(story, batch)
+        except Exception as e:
+            logger.error("Mock eval failed: %s", e)
+            return
+        eval_ms = (loop.time() - t0) * 1000
+
+        results = [
+            _finish_result(d.to_dict(), story, m, eval_ms)
+            for d, m in zip(decisions, batch)
+        ]
+        if ws_server.client_count:
+            ws_server.broadcast_bytes(_encode({"type": "decisions", "data": results}))
 
     def _subscribe_market(market: MarketConfig) -> None:
         cb = _make_market_callback(market)
@@ -266,101 +465,178 @@ async def run(*, use_mock: bool = False, use_local: bool = False) -> None:
 
     # ── News callback ──────────────────────────────────────────────
     message_count = 0
+    eval_tasks: set[asyncio.Task] = set()  # in-flight bus fan-outs
+    warm_tasks: set[asyncio.Task] = set()  # per-market warm-ups from enable commands
+    eval_dropped = 0
 
     async def on_news(news):
-        nonlocal message_count
+        nonlocal message_count, eval_dropped
         message_count += 1
 
-        tag_str = ""
-        if "HOT" in news.urgency_tags:
-            tag_str = "[HOT] "
-        elif news.is_priority:
-            tag_str = "[HIGH] "
-
-        if "HOT" in news.urgency_tags or news.is_priority:
-            logger.info(f"{tag_str}{news.headline[:60]}...")
+        if logger.isEnabledFor(logging.INFO):
+            level_tag = "HOT" if "HOT" in news.urgency_tags else "HIGH" if news.is_priority else None
+            if level_tag:
+                logger.info("[%s] %s...", level_tag, news.headline[:60])
 
         tagged = None
         try:
             tagged = tagger.tag(news)
         except Exception as e:
-            logger.error(f"Tagger failed: {e}", extra={"news_id": news.id})
+            logger.error("Tagger failed: %s", e, extra={"news_id": news.id})
 
-        asyncio.create_task(ws_server.broadcast(news, tagged))
+        _enqueue_broadcast("news", news, tagged)
 
         tags = tuple(c.value for c in tagged.categories) if tagged and tagged.categories else ()
         if not tags:
             return
 
+        # Bounded fan-out: when evals can't keep up, shed new stories rather
+        # than pile up tasks behind the Modal semaphore
+        if len(eval_tasks) >= MAX_INFLIGHT_STORIES:
+            eval_dropped += 1
+            if eval_dropped % 100 == 1:
+                logger.warning(
+                    "Eval backlog at %d stories — skipped %d story eval(s) so far",
+                    len(eval_tasks), eval_dropped,
+                )
+            return
+
         story = StoryPayload(
             id=news.id,
             headline=news.headline,
             body=getattr(news, "body", ""),
             tags=tags,
             source=getattr(news, "source_handle", ""),
-            timestamp=datetime.now(timezone.utc),
+            timestamp=time.time_ns(),
         )
 
-        await bus.publish(tags, story)
+        # Don't hold the feed on the slowest market: each market callback
+        # broadcasts its own decision the moment its eval completes (mock
+        # mode evaluates the matched markets as one batch instead).
+        if use_mock and not use_local:
+            task = asyncio.create_task(_mock_dispatch(tags, story))
+        else:
+            task = asyncio.create_task(bus.publish(tags, story))
+        eval_tasks.add(task)
+        task.add_done_callback(eval_tasks.discard)
 
     # ── Agent warm-up ─────────────────────────────────────────────
 
-    async def _warmup_agent() -> None:
-        dummy_market = MarketConfig(
-            address="warmup",
-            question=markets[0].question if markets else "Will it rain tomorrow?",
-            current_probability=0.5,
-            tags=("warmup",),
-        )
-        dummy_story = StoryPayload(
-            id="warmup",
+    def _warmup_story(story_id: str) -> StoryPayload:
+        return StoryPayload(
+            id=story_id,
             headline="warmup ping — ignore",
             body="",
             tags=("warmup",),
             source="warmup",
-            timestamp=datetime.now(timezone.utc),
+            timestamp=time.time_ns(),
+        )
+
+    async def _warmup_modal(targets: list[MarketConfig]) -> None:
+        """Send one dummy eval per market concurrently so Modal boots that many replicas."""
+        warmed_markets.update(m.address for m in targets)
+        modal_eval = _get_modal_eval()
+        dummies = [
+            (
+                _warmup_story(f"warmup-{i}").to_dict(),
+                MarketConfig(
+                    address=f"warmup-{i}",
+                    question=m.question,
+                    current_probability=0.5,
+                    tags=("warmup",),
+                ).to_dict(),
+            )
+            for i, m in enumerate(targets)
+        ]
+
+        async def _ping(story: dict, market: dict):
+            # Same cap as real evals, so warm-ups can't exceed MODAL_MAX_CONCURRENCY
+            async with modal_sem:
+                return await modal_eval(story, market)
+
+        t0 = time.monotonic()
+        results = await asyncio.gather(
+            *[_ping(story, market) for story, market in dummies],
+            return_exceptions=True,
+        )
+        warmup_ms = (time.monotonic() - t0) * 1000
+        failed = [r for r in results if isinstance(r, Exception)]
+        if failed:
+            logger.warning(
+                "Modal warm-up: %d/%d calls failed (non-fatal): %s",
+                len(failed), len(results), failed[0],
+            )
+        logger.info(
+            "Modal warm-up complete — %d replica(s) in %.0fms",
+            len(results) - len(failed), warmup_ms,
         )
 
+    async def _warm_keeper() -> None:
+        """Ping enabled markets that saw no real eval for a full interval."""
+        while True:
+            await asyncio.sleep(WARM_INTERVAL)
+            cutoff = loop.time() - WARM_INTERVAL
+            idle = [
+                market_by_addr[addr] for addr in enabled_markets
+                if last_real_eval.get(addr, 0.0) < cutoff
+            ]
+            if not idle:
+                continue
+            try:
+                # Keeping MODAL_WARM_REPLICAS containers alive is enough
+                await _warmup_modal(idle[:MODAL_WARM_REPLICAS])
+            except Exception as e:
+                logger.warning("Modal keep-warm failed (non-fatal): %s", e)
+
+    async def _warmup_agent() -> None:
         if use_local:
             logger.info("Warming up Groq client (local)...")
+            dummy_market = MarketConfig(
+                address="warmup",
+                question=markets[0].question if markets else "Will it rain tomorrow?",
+                current_probability=0.5,
+                tags=("warmup",),
+            )
             try:
-                from agents.agent_logic import evaluate as groq_evaluate
                 groq = _get_groq_client()
                 t0 = time.monotonic()
-                await groq_evaluate(dummy_story, dummy_market, groq)
+                await groq_evaluate(_warmup_story("warmup"), dummy_market, groq)
                 warmup_ms = (time.monotonic() - t0) * 1000
                 logger.info(f"Groq warm-up complete — {warmup_ms:.0f}ms")
             except Exception as e:
                 logger.warning(f"Groq warm-up failed (non-fatal): {e}")
         else:
-            logger.info("Warming up Modal container (Groq agent)...")
-            try:
-                agent = _get_modal_agent()
-                t0 = time.monotonic()
-                await agent.evaluate.remote.aio(
-                    dummy_story.to_dict(), dummy_market.to_dict()
+            targets = markets[:MODAL_WARM_REPLICAS] or [
+                MarketConfig(
+                    address="warmup",
+                    question="Will it rain tomorrow?",
+                    current_probability=0.5,
+                    tags=("warmup",),
                 )
-                warmup_ms = (time.monotonic() - t0) * 1000
-                logger.info(f"Modal warm-up complete — {warmup_ms:.0f}ms (container is hot)")
+            ]
+            logger.info(f"Warming up {len(targets)} Modal container(s) (Groq agent)...")
+            try:
+                await _warmup_modal(targets)
             except Exception as e:
                 logger.warning(f"Modal warm-up failed (non-fatal): {e}")
 
     # ── Register callbacks ─────────────────────────────────────────
     if dbnews_client is not None:
         dbnews_client.on_message(on_news)
-        dbnews_client.on_error(lambda e: logger.error(f"DBNews error: {e}"))
+        dbnews_client.on_error(lambda e: logger.error("DBNews error: %s", e))
         dbnews_client.on_reconnect(lambda: logger.info("DBNews reconnected"))
 
     # ── Start services ─────────────────────────────────────────────
     logger.info("Starting trademaxxer server")
 
-    ws_server.set_welcome_extra({"markets_state": _markets_state_payload()})
+    broadcast_task = asyncio.create_task(_broadcast_worker())
+    tick_task = asyncio.create_task(_tick_flusher())
+    warm_task: asyncio.Task | None = None
+    if not use_mock and not use_local:
+        warm_task = asyncio.create_task(_warm_keeper())
 
-    await ws_server.start()
-    logger.info(
-        f"WebSocket server listening on "
-        f"ws://{settings.websocket_server.host}:{settings.websocket_server.port}"
-    )
+    ws_server.set_welcome_extra({"markets_state": _markets_state_payload()})
+    _schedule_markets_state_flush()  # clients that connected early
 
     # ── HTTP API Server ────────────────────────────────────────────
     from aiohttp import web, hdrs
@@ -379,7 +655,7 @@ async def run(*, use_mock: bool = False, use_local: bool = False) -> None:
 
         # Fetch DFlow markets and create mappings
         dflow_markets_data = await dflow_executor.get_dflow_markets()
-        kalshi_markets_data = [m.to_dict() for m in markets if m.address not in demo_addrs]
+        kalshi_markets_data = [market_dicts[m.address] for m in real_markets]
 
         mappings = market_mapper.create_mappings(kalshi_markets_data,
             [{"market_id": m.dflow_market_id, "question": m.question} for m in dflow_markets_data])
@@ -458,7 +734,7 @@ async def run(*, use_mock: bool = False, use_local: bool = False) -> None:
 
             # Broadcast trade result to WebSocket clients
             if result.get('success'):
-                await ws_server.broadcast_json({
+                _enqueue_broadcast("json", {
                     "type": "trade_executed",
                     "data": {
                         "venue": "dflow",
@@ -588,13 +864,10 @@ async def run(*, use_mock: bool = False, use_local: bool = False) -> None:
     logger.info("Demo headline injector started")
 
     # Start live market price updates
-    if live_market_manager and markets:
+    if live_market_manager and real_markets:
         try:
-            # Filter out demo markets for live updates (they don't have real tickers)
-            real_markets = [m for m in markets if m.address not in demo_addrs]
-            if real_markets:
-                await live_market_manager.start(real_markets)
-                logger.info(f"Started live price updates for {len(real_markets)} real markets")
+            await live_market_manager.start(real_markets)
+            logger.info(f"Started live price updates for {len(real_markets)} real markets")
         except Exception as e:
             logger.error(f"Failed to start live market updates: {e}")
             # Continue without live updates
@@ -605,43 +878,62 @@ async def run(*, use_mock: bool = False, use_local: bool = False) -> None:
     # ── Teardown ───────────────────────────────────────────────────
     logger.info("Shutting down...")
 
-    for task in (mock_task, demo_task):
-        if task and not task.done():
-            task.cancel()
-            try:
-                await task
-            except asyncio.CancelledError:
-                pass
+    # One cancel scope: background loops and in-flight fan-outs are
+    # cancelled together and awaited in a single bounded wait.
+    pending = [
+        task
+        for task in (
+            mock_task, demo_task, broadcast_task, tick_task, warm_task,
+            markets_state_flush, *eval_tasks, *warm_tasks,
+        )
+        if task and not task.done()
+    ]
+    for task in pending:
+        task.cancel()
+    # asyncio.wait, not wait_for(gather): on timeout wait_for would itself
+    # wait for a task that swallows cancellation, and never return
+    if pending:
+        _, not_done = await asyncio.wait(pending, timeout=TASK_SHUTDOWN_TIMEOUT)
+    else:
+        not_done = set()
+    if not_done:
+        stuck = [t.get_name() for t in not_done]
+        logger.warning(
+            "%d task(s) ignored cancellation for %.0fs, abandoning: %s",
+            len(stuck), TASK_SHUTDOWN_TIMEOUT, ", ".join(stuck),
+        )
+    eval_tasks.clear()
+    warm_tasks.clear()
+
+    # Services stop concurrently, each bounded, so one hung close can't
+    # hold up the rest or the process exit
+    async def _bounded_stop(name: str, coro) -> None:
+        task = asyncio.create_task(coro)
+        done, _ = await asyncio.wait({task}, timeout=SERVICE_SHUTDOWN_TIMEOUT)
+        if not done:
+            task.cancel()  # not awaited: a stop that swallows cancellation can't block exit
+            logger.warning(f"Timed out stopping {name} after {SERVICE_SHUTDOWN_TIMEOUT:.0f}s")
+        elif task.exception() is not None:
+            logger.warning(f"Error stopping {name}: {task.exception()}")
+        else:
+            logger.info(f"Stopped {name}")
 
-    await ws_server.stop()
+    async def _stop_live_markets() -> None:
+        await live_market_manager.stop()
+        await live_market_manager.__aexit__(None, None, None)
 
-    # Stop HTTP API server
+    stops = [("WebSocket server", ws_server.stop())]
     if 'http_runner' in locals():
-        try:
-            await http_runner.cleanup()
-            logger.info("Stopped HTTP API server")
-        except Exception as e:
-            logger.warning(f"Error stopping HTTP server: {e}")
-
-    # Stop DFlow executor
+        stops.append(("HTTP API server", http_runner.cleanup()))
     if dflow_executor:
-        try:
-            await dflow_executor.__aexit__(None, None, None)
-            logger.info("Stopped DFlow executor")
-        except Exception as e:
-            logger.warning(f"Error stopping DFlow executor: {e}")
-
-    # Stop live market updates
+        stops.append(("DFlow executor", dflow_executor.__aexit__(None, None, None)))
     if live_market_manager:
-        try:
-            await live_market_manager.stop()
-            await live_market_manager.__aexit__(None, None, None)
-            logger.info("Stopped live market updates")
-        except Exception as e:
-            logger.warning(f"Error stopping live market manager: {e}")
+        stops.append(("live market updates", _stop_live_markets()))
+    if dbnews_client is not None:
+        stops.append(("DBNews client", dbnews_client.disconnect()))
+    await asyncio.gather(*[_bounded_stop(name, coro) for name, coro in stops])
 
     if dbnews_client is not None:
-        await dbnews_client.disconnect()
         stats = dbnews_client.get_stats()
         ws_stats = ws_server.get_stats()
         tagger_stats = tagger.stats
@@ -666,4 +958,18 @@ if __name__ == "__main__":
     parser.add_argument("--mock", action="store_true", help="Use mock news feed instead of DBNews")
     parser.add_argument("--local", action="store_true", help="Call Groq API locally instead of via Modal")
     args = parser.parse_args()
-    asyncio.run(run(use_mock=args.mock, use_local=args.local))
+
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+
+    # Not asyncio.run(): its final cancel-and-wait over leftover tasks would
+    # hang on the ones teardown already abandoned for ignoring cancellation
+    loop = asyncio.new_event_loop()
+    try:
+        loop.run_until_complete(run(use_mock=args.mock, use_local=args.local))
+        loop.run_until_complete(loop.shutdown_asyncgens())
+    finally:
+        loop.close()
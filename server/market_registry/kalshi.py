@@ -7,20 +7,189 @@ Provides tag extraction and market filtering for news-relevant markets.
 from __future__ import annotations
 
 import asyncio
+import functools
+import heapq
 import logging
+import operator
 import re
 import time
+from contextlib import aclosing
 from datetime import datetime, timezone, timedelta
 from typing import Any
 
 import aiohttp
+import orjson
 
 from agents.schemas import MarketConfig
 
+# Optional: multi-pattern automaton for the sports filter (falls back to regex)
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
 
 logger = logging.getLogger(__name__)
 
 
+# ---------------------------------------------------------------------------
+# Keyword classification — compiled once at import
+# ---------------------------------------------------------------------------
+
+# Keywords match whole words (plural "s" allowed); a trailing "*" marks
+# a stem that matches any word starting with it (e.g. "geopolit*").
+SPORTS_KEYWORDS: tuple[str, ...] = (
+    "basketball", "nba", "football", "nfl", "soccer", "premier league",
+    "manchester", "barcelona", "liverpool", "chelsea", "arsenal",
+    "lebron", "luka", "goals", "points", "scored", "charlotte", "bruins",
+    "patriots", "cowboys", "packers", "steelers", "49ers", "eagles",
+    "lakers", "warriors", "celtics", "heat", "knicks", "bulls",
+    "yankees", "dodgers", "red sox", "astros", "mets", "giants",
+    "tournament", "championship", "playoff", "bowl", "cup", "league",
+    "team", "coach", "player", "draft", "trade", "season", "game",
+    "match", "win", "lose", "defeat", "victory", "score", "stats",
+    "roster", "mvp", "rookie", "veteran", "contract", "signing",
+)
+
+TAG_KEYWORDS: dict[str, tuple[str, ...]] = {
+    "politics": (
+        "election", "president", "congress", "senate", "vote", "biden",
+        "trump", "harris", "political", "government", "executive order",
+        "sanctions", "war", "invasion", "conflict", "military", "nato",
+        "geopolit*", "ceasefire", "diplomacy",
+    ),
+    "economics": (
+        "fed", "federal reserve", "interest rate", "inflation", "gdp",
+        "recession", "unemployment", "jobs", "cpi", "ppi", "fomc",
+        "tariff", "trade deal", "debt ceiling", "treasury",
+    ),
+    "crypto": (
+        "bitcoin", "btc", "ethereum", "eth", "crypto*", "solana", "sol",
+        "stablecoin", "defi", "nft",
+    ),
+    "financials": (
+        "s&p", "dow", "nasdaq", "stock", "ipo", "bond", "yield",
+        "earnings", "revenue", "oil", "gold", "crude", "commodity",
+        "forex", "dollar",
+    ),
+    "companies": (
+        "apple", "google", "microsoft", "amazon", "tesla", "nvidia",
+        "meta", "openai", "spacex",
+    ),
+    "tech_science": (
+        "ai", "artificial intelligence", "quantum", "chip", "semiconductor",
+        "fda", "vaccine", "space", "launch", "nuclear",
+    ),
+    "climate": (
+        "climate", "carbon", "emission", "hurricane", "wildfire",
+        "temperature", "drought", "flood", "epa",
+    ),
+    "culture": (
+        "oscar", "grammy", "emmy", "box office", "celebrity",
+        "entertainment", "movie", "album",
+    ),
+    "sports": (
+        "nba", "nfl", "mlb", "nhl", "fifa", "super bowl", "world cup",
+        "championship", "playoff", "tournament",
+    ),
+}
+
+
+def _keyword_regex(keywords: tuple[str, ...]) -> re.Pattern[str]:
+    """One alternation over all keywords, anchored on word boundaries."""
+    words = sorted((k for k in keywords if not k.endswith("*")), key=len, reverse=True)
+    stems = [k[:-1] for k in keywords if k.endswith("*")]
+    parts = []
+    if words:
+        parts.append(r"(?:%s)s?\b" % "|".join(map(re.escape, words)))
+    if stems:
+        parts.append(r"(?:%s)" % "|".join(map(re.escape, stems)))
+    return re.compile(r"(?<![\w&])(?:%s)" % "|".join(parts))
+
+
+_SPORTS_RE = _keyword_regex(SPORTS_KEYWORDS)
+# Tag buckets split by how they match: single-token keywords are set lookups
+# against the question's tokens; phrases and stems fall back to a regex.
+_TOKEN_RE = re.compile(r"[\w&]+")
+_TAG_WORDS: dict[str, frozenset[str]] = {
+    name: frozenset(k for k in words if _TOKEN_RE.fullmatch(k))
+    for name, words in TAG_KEYWORDS.items()
+}
+_TAG_PHRASES: dict[str, re.Pattern[str]] = {
+    name: _keyword_regex(rest)
+    for name, words in TAG_KEYWORDS.items()
+    if (rest := tuple(k for k in words if not _TOKEN_RE.fullmatch(k)))
+}
+# All phrase buckets in one alternation; the named group that matched is the
+# bucket, so a single scan of the question covers every bucket.
+_TAG_PHRASE_RE = re.compile(
+    "|".join(f"(?P<{name}>{pattern.pattern})" for name, pattern in _TAG_PHRASES.items())
+)
+
+
+def _build_automaton(keywords: tuple[str, ...]):
+    automaton = ahocorasick.Automaton()
+    for keyword in keywords:
+        automaton.add_word(keyword, len(keyword))
+    automaton.make_automaton()
+    return automaton
+
+
+_SPORTS_AC = _build_automaton(SPORTS_KEYWORDS) if ahocorasick is not None else None
+
+
+def _is_whole_word(text: str, start: int, end: int) -> bool:
+    """Same boundary rule as _keyword_regex: text[start:end] (+ optional "s") is a word."""
+    if start and (text[start - 1].isalnum() or text[start - 1] in "_&"):
+        return False
+    if end < len(text) and text[end] == "s":
+        end += 1
+    return end == len(text) or not (text[end].isalnum() or text[end] == "_")
+
+
+def _has_sports_keyword(text: str) -> bool:
+    """One linear pass over `text` for any sports keyword; stops at the first hit."""
+    if _SPORTS_AC is None:
+        return _SPORTS_RE.search(text) is not None
+    for end, length in _SPORTS_AC.iter(text):
+        if _is_whole_word(text, end - length + 1, end + 1):
+            return True
+    return False
+
+
+# Pure functions of the already-lowercased question text. Event titles repeat
+# for every market in the event, and subtitles recur across events, so both
+# are memoized. Callers lowercase once and pass the result through.
+
+@functools.lru_cache(maxsize=4096)
+def _is_sports_lower(q: str) -> bool:
+    return _has_sports_keyword(q)
+
+
+# Interned tag tuples: only a handful of bucket combinations ever occur, so
+# every market with the same tags shares one tuple object.
+_TAG_TUPLES: dict[frozenset[str], tuple[str, ...]] = {}
+
+
+@functools.lru_cache(maxsize=4096)
+def _extract_tags(q: str) -> tuple[str, ...]:
+    words = _TOKEN_RE.findall(q)
+    # Plural "s" is allowed, so each "...s" token also stands for its stem
+    tokens = frozenset(words).union([w[:-1] for w in words if w[-1] == "s"])
+
+    tags = {name for name, kw in _TAG_WORDS.items() if not kw.isdisjoint(tokens)}
+    tags.update(m.lastgroup for m in _TAG_PHRASE_RE.finditer(q))
+
+    if not tags:
+        tags.add("mentions")
+
+    key = frozenset(tags)
+    interned = _TAG_TUPLES.get(key)
+    if interned is None:
+        interned = _TAG_TUPLES[key] = tuple(sorted(tags))
+    return interned
+
+
 class KalshiMarketRegistry:
     """
     Live market registry backed by Kalshi API.
@@ -35,11 +204,13 @@ class KalshiMarketRegistry:
         min_volume_24h: int = 0,  # Accept zero volume to get more markets
         max_close_days: int = 365,  # Longer timeframe for more options
         max_markets: int = 100,  # Much higher limit for more market options
+        max_event_pages: int = 5,  # Cursor pages of 200 events to walk at most
     ):
         self.base_url = base_url
         self.min_volume_24h = min_volume_24h
         self.max_close_days = max_close_days
         self.max_markets = max_markets
+        self.max_event_pages = max_event_pages
         self._session: aiohttp.ClientSession | None = None
 
     async def __aenter__(self):
@@ -78,80 +249,110 @@ class KalshiMarketRegistry:
         }
 
         try:
-            # Fetch events with nested markets
-            async with self._session.get(f"{self.base_url}/events", params=params) as resp:
-                resp.raise_for_status()
-                data = await resp.json()
-
-            raw_events = data.get("events", [])
-            logger.info(f"Retrieved {len(raw_events)} raw events from Kalshi")
-
-            markets = []
+            # (market_config, volume_score) pairs, scored while the raw market is in hand
+            markets_with_volume: list[tuple[MarketConfig, float]] = []
             total_events_checked = 0
             filtered_out_events = 0
 
-            for event in raw_events:
-                total_events_checked += 1
-                event_title = event.get("title", "")
-
-                # Check if event title is news-relevant
-                if not self._is_news_relevant_question(event_title):
-                    filtered_out_events += 1
-                    logger.debug(f"Filtered out event: {event_title[:50]}...")
-                    continue
-
-                logger.info(f"Processing news-relevant event: {event_title[:80]}...")
-
-                # Process markets within this event
-                event_markets = event.get("markets", [])
-                processed_markets = 0
-
-                for market in event_markets:
-                    # TEMPORARILY SKIP ALL MARKET FILTERING FOR TESTING
-                    try:
-                        config = self._convert_event_market_to_config(event, market)
-                        markets.append(config)
-                        processed_markets += 1
-                        logger.info(f"  Added market: {config.question[:60]}...")
-                    except Exception as e:
-                        logger.warning(f"Failed to convert market {market.get('ticker', '?')}: {e}")
-
-                if processed_markets > 0:
-                    logger.info(f"  → Added {processed_markets} markets from this event")
+            # Fetch events with nested markets, page by page
+            async with aclosing(self._iter_event_pages(params)) as pages:
+                async for raw_events in pages:
+                    logger.info(f"Retrieved {len(raw_events)} raw events from Kalshi")
+                    for event in raw_events:
+                        total_events_checked += 1
+                        event_title = event.get("title", "")
+                        event_title_l = event_title.lower()
+
+                        # Check if event title is news-relevant
+                        if not self._is_news_relevant_lower(event_title_l):
+                            filtered_out_events += 1
+                            logger.debug(f"Filtered out event: {event_title[:50]}...")
+                            continue
+
+                        logger.info(f"Processing news-relevant event: {event_title[:80]}...")
+
+                        # Process markets within this event
+                        event_markets = event.get("markets", [])
+                        processed_markets = 0
+
+                        for market in event_markets:
+                            # TEMPORARILY SKIP ALL MARKET FILTERING FOR TESTING
+                            try:
+                                config = self._convert_event_market_to_config(event, market, event_title_l)
+                                markets_with_volume.append((config, self._get_volume_score(market)))
+                                processed_markets += 1
+                                logger.info(f"  Added market: {config.question[:60]}...")
+                            except Exception as e:
+                                logger.warning(f"Failed to convert market {market.get('ticker', '?')}: {e}")
+
+                        if processed_markets > 0:
+                            logger.info(f"  → Added {processed_markets} markets from this event")
+
+                        # Limit total markets
+                        if len(markets_with_volume) >= self.max_markets:
+                            break
 
-                # Limit total markets
-                if len(markets) >= self.max_markets:
-                    break
+                    if len(markets_with_volume) >= self.max_markets:
+                        break
 
             logger.info(f"Event filtering: {total_events_checked} total, {filtered_out_events} filtered out, {total_events_checked - filtered_out_events} processed")
 
-            # Create tuples of (market_config, volume_data) for sorting
-            markets_with_volume = []
-            for market in markets:
-                # Find the original market data to get volume
-                volume_score = 0
-                for event in raw_events:
-                    for event_market in event.get("markets", []):
-                        if event_market.get("ticker") == market.address:
-                            volume_24h = event_market.get("volume_24h", 0)
-                            open_interest = event_market.get("open_interest", 0)
-                            volume_score = volume_24h + (open_interest * 0.1)
-                            break
-                markets_with_volume.append((market, volume_score))
-
-            # Sort by volume score (highest first)
-            markets_with_volume.sort(key=lambda x: x[1], reverse=True)
-
-            # Extract just the market configs and limit
-            markets = [m[0] for m in markets_with_volume[:self.max_markets]]
+            # Top max_markets by volume score (highest first, ties keep fetch order)
+            top = heapq.nlargest(self.max_markets, markets_with_volume, key=operator.itemgetter(1))
+            markets = [m[0] for m in top]
 
             logger.info(f"Selected {len(markets)} news-relevant markets from events")
+            logger.debug(
+                "Classifier caches — sports: %s, tags: %s",
+                _is_sports_lower.cache_info(), _extract_tags.cache_info(),
+            )
             return markets
 
         except Exception as e:
             logger.error(f"Failed to fetch events from Kalshi: {e}")
             return []
 
+    async def _fetch_events_page(self, params: dict[str, Any], cursor: str | None) -> dict:
+        page_params = {**params, "cursor": cursor} if cursor else params
+        async with self._session.get(f"{self.base_url}/events", params=page_params) as resp:
+            resp.raise_for_status()
+            return orjson.loads(await resp.read())
+
+    async def _iter_event_pages(self, params: dict[str, Any]):
+        """
+        Yield each page's event list, following the response cursor.
+
+        Cursor pages can't be requested in parallel (each cursor comes from
+        the previous response), so the next page is prefetched while the
+        caller processes the current one. Stops after max_event_pages.
+        A failure on the first page propagates; a failure on a later page
+        ends pagination and keeps what was already yielded.
+        """
+        task = asyncio.create_task(self._fetch_events_page(params, None))
+        try:
+            for page_no in range(self.max_event_pages):
+                try:
+                    data = await task
+                except Exception as e:
+                    if page_no == 0:
+                        raise
+                    logger.warning(f"Failed to fetch Kalshi events page {page_no + 1}, stopping pagination: {e}")
+                    task = None
+                    return
+                task = None
+                cursor = data.get("cursor")
+                if cursor and page_no + 1 < self.max_event_pages:
+                    task = asyncio.create_task(self._fetch_events_page(params, cursor))
+                yield data.get("events", [])
+                if task is None:
+                    return
+        finally:
+            if task is not None:
+                if task.done() and not task.cancelled():
+                    task.exception()  # mark a failed prefetch as retrieved
+                else:
+                    task.cancel()
+
     def _is_market_suitable(self, market: dict) -> bool:
         """Filter for news-relevant, liquid markets."""
 
@@ -162,7 +363,7 @@ class KalshiMarketRegistry:
 
         # Check if question is news-relevant
         question = market.get("yes_sub_title", "").lower()
-        if not self._is_news_relevant_question(question):
+        if not self._is_news_relevant_lower(question):
             return False
 
         # Allow zero price for testing (new markets haven't been traded yet)
@@ -172,28 +373,12 @@ class KalshiMarketRegistry:
 
         return True
 
-    def _is_news_relevant_question(self, question: str) -> bool:
-        """Check if market question is driven by news events."""
-
-        question_lower = question.lower()
-
-        # Exclude sports-related markets
-        sports_keywords = [
-            "basketball", "nba", "football", "nfl", "soccer", "premier league",
-            "manchester", "barcelona", "liverpool", "chelsea", "arsenal",
-            "lebron", "luka", "goals", "points", "scored", "charlotte", "bruins",
-            "patriots", "cowboys", "packers", "steelers", "49ers", "eagles",
-            "lakers", "warriors", "celtics", "heat", "knicks", "bulls",
-            "yankees", "dodgers", "red sox", "astros", "mets", "giants",
-            "tournament", "championship", "playoff", "bowl", "cup", "league",
-            "team", "coach", "player", "draft", "trade", "season", "game",
-            "match", "win", "lose", "defeat", "victory", "score", "stats",
-            "roster", "mvp", "rookie", "veteran", "contract", "signing"
-        ]
+    def _is_news_relevant_lower(self, question: str) -> bool:
+        """Check if a (lowercased) market question is driven by news events."""
 
         # TEMPORARILY ACCEPT ALL NON-SPORTS EVENTS FOR TESTING
         # Return False if question contains sports keywords
-        if any(keyword in question_lower for keyword in sports_keywords):
+        if _is_sports_lower(question):
             logger.debug(f"Excluding sports market: {question[:50]}...")
             return False
 
@@ -211,12 +396,12 @@ class KalshiMarketRegistry:
         last_price_str = market["last_price_dollars"]
         probability = float(last_price_str)  # Kalshi prices are already 0.0-1.0
 
-        # Parse expiration
+        # Parse expiration (fromisoformat accepts the trailing 'Z' on 3.11+)
         close_time_str = market["close_time"]
-        expires_at = datetime.fromisoformat(close_time_str.replace('Z', '+00:00'))
+        expires_at = datetime.fromisoformat(close_time_str)
 
         # Extract tags from question
-        tags = self._extract_tags_from_question(question)
+        tags = self._extract_tags_from_question(question.lower())
 
         rules_primary = (market.get("rules_primary") or "").strip()
 
@@ -230,73 +415,8 @@ class KalshiMarketRegistry:
         )
 
     def _extract_tags_from_question(self, question: str) -> tuple[str, ...]:
-        """Map market question to Kalshi-aligned categories."""
-
-        q = question.lower()
-        tags: set[str] = set()
-
-        if any(w in q for w in [
-            "election", "president", "congress", "senate", "vote", "biden",
-            "trump", "harris", "political", "government", "executive order",
-            "sanctions", "war", "invasion", "conflict", "military", "nato",
-            "geopolit", "ceasefire", "diplomacy",
-        ]):
-            tags.add("politics")
-
-        if any(w in q for w in [
-            "fed", "federal reserve", "interest rate", "inflation", "gdp",
-            "recession", "unemployment", "jobs", "cpi", "ppi", "fomc",
-            "tariff", "trade deal", "debt ceiling", "treasury",
-        ]):
-            tags.add("economics")
-
-        if any(w in q for w in [
-            "bitcoin", "btc", "ethereum", "eth", "crypto", "solana", "sol",
-            "stablecoin", "defi", "nft",
-        ]):
-            tags.add("crypto")
-
-        if any(w in q for w in [
-            "s&p", "dow", "nasdaq", "stock", "ipo", "bond", "yield",
-            "earnings", "revenue", "oil", "gold", "crude", "commodity",
-            "forex", "dollar",
-        ]):
-            tags.add("financials")
-
-        if any(w in q for w in [
-            "apple", "google", "microsoft", "amazon", "tesla", "nvidia",
-            "meta", "openai", "spacex",
-        ]):
-            tags.add("companies")
-
-        if any(w in q for w in [
-            "ai", "artificial intelligence", "quantum", "chip", "semiconductor",
-            "fda", "vaccine", "space", "launch", "nuclear",
-        ]):
-            tags.add("tech_science")
-
-        if any(w in q for w in [
-            "climate", "carbon", "emission", "hurricane", "wildfire",
-            "temperature", "drought", "flood", "epa",
-        ]):
-            tags.add("climate")
-
-        if any(w in q for w in [
-            "oscar", "grammy", "emmy", "box office", "celebrity",
-            "entertainment", "movie", "album",
-        ]):
-            tags.add("culture")
-
-        if any(w in q for w in [
-            "nba", "nfl", "mlb", "nhl", "fifa", "super bowl", "world cup",
-            "championship", "playoff", "tournament",
-        ]):
-            tags.add("sports")
-
-        if not tags:
-            tags.add("mentions")
-
-        return tuple(sorted(tags))
+        """Map a (lowercased) market question to Kalshi-aligned categories."""
+        return _extract_tags(question)
 
     def _is_market_suitable_from_event(self, market: dict, now: int, max_close_ts: int) -> bool:
         """Check if a market from an event meets our criteria for news trading."""
@@ -308,7 +428,7 @@ class KalshiMarketRegistry:
         close_time_str = market.get("close_time")
         if close_time_str:
             try:
-                close_time = datetime.fromisoformat(close_time_str.replace('Z', '+00:00'))
+                close_time = datetime.fromisoformat(close_time_str)
                 close_ts = int(close_time.timestamp())
                 days_to_close = (close_ts - now) / (24 * 3600)
 
@@ -344,8 +464,13 @@ class KalshiMarketRegistry:
 
         return True
 
-    def _convert_event_market_to_config(self, event: dict, market: dict) -> MarketConfig:
-        """Convert event + market data to TradeMaxxer MarketConfig."""
+    def _convert_event_market_to_config(
+        self, event: dict, market: dict, event_title_l: str | None = None
+    ) -> MarketConfig:
+        """Convert event + market data to TradeMaxxer MarketConfig.
+
+        `event_title_l` is the lowercased event title, if the caller has it.
+        """
         ticker = market["ticker"]
 
         # Use event title + market subtitle for better context
@@ -368,13 +493,15 @@ class KalshiMarketRegistry:
         # Parse expiration
         close_time_str = market.get("close_time", "")
         try:
-            expires_at = datetime.fromisoformat(close_time_str.replace('Z', '+00:00'))
+            expires_at = datetime.fromisoformat(close_time_str)
         except ValueError:
             expires_at = None
 
         # Extract tags from event title and market subtitle
-        combined_text = f"{event_title} {market_subtitle}".lower()
-        tags = self._extract_tags_from_question(combined_text)
+        if event_title_l is None:
+            event_title_l = event_title.lower()
+        combined_lower = f"{event_title_l} {market_subtitle.lower()}"
+        tags = _extract_tags(combined_lower)  # cached; skips the method hop per market
 
         rules_primary = (market.get("rules_primary") or "").strip()
 
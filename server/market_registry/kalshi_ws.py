@@ -6,15 +6,24 @@ Provides live market data streaming to replace static prices with real-time upda
 from __future__ import annotations
 
 import asyncio
-import json
+import itertools
 import logging
 import time
 from datetime import datetime
 from typing import Any, Callable
 
 import aiohttp
+import orjson
 import websockets
 
+# Signing deps are only needed once a client authenticates
+try:
+    import jwt
+    from cryptography.hazmat.primitives import serialization
+except ImportError:
+    jwt = None
+    serialization = None
+
 from agents.schemas import MarketConfig
 
 
@@ -46,14 +55,24 @@ class KalshiWebSocketClient:
         self._session: aiohttp.ClientSession | None = None
         self._websocket: websockets.WebSocketServerProtocol | None = None
         self._access_token: str | None = None
+        self._signing_key: Any = None  # parsed from private_key on first auth
         self._token_expires: float = 0
         self._subscribed_markets: set[str] = set()
         self._running = False
+        self._ready = asyncio.Event()  # set while the socket is connected
 
         # Callbacks
         self._on_price_update: Callable[[str, float], None] | None = None
         self._on_error: Callable[[Exception], None] | None = None
 
+        # Message type -> handler, looked up once per inbound frame
+        self._dispatch: dict[str, Callable[[dict], None]] = {
+            "orderbook_delta": self._on_orderbook_delta,
+            "error": self._on_ws_error,
+            "subscribed": self._on_sub_ack,
+            "unsubscribed": self._on_sub_ack,
+        }
+
     async def __aenter__(self):
         self._session = aiohttp.ClientSession()
         return self
@@ -100,6 +119,7 @@ class KalshiWebSocketClient:
                     await asyncio.sleep(self.reconnect_interval)
 
             finally:
+                self._ready.clear()
                 if self._websocket:
                     await self._websocket.close()
                     self._websocket = None
@@ -107,34 +127,51 @@ class KalshiWebSocketClient:
     async def disconnect(self) -> None:
         """Disconnect from Kalshi WebSocket."""
         self._running = False
+        self._ready.clear()
         if self._websocket:
             await self._websocket.close()
             self._websocket = None
         logger.info("Kalshi WebSocket client disconnected")
 
+    async def wait_until_connected(self, timeout: float | None = None) -> bool:
+        """Wait for the socket to be up; returns False if `timeout` expires first."""
+        try:
+            await asyncio.wait_for(self._ready.wait(), timeout)
+        except asyncio.TimeoutError:
+            return False
+        return True
+
     async def subscribe_to_markets(self, tickers: list[str]) -> None:
         """Subscribe to price updates for specific market tickers."""
         if not self._websocket:
             logger.warning("Cannot subscribe: WebSocket not connected")
             return
 
-        new_tickers = set(tickers) - self._subscribed_markets
+        # dict.fromkeys dedupes while keeping the caller's order
+        subscribed = self._subscribed_markets
+        new_tickers = [t for t in dict.fromkeys(tickers) if t not in subscribed]
         if not new_tickers:
             return
 
-        # Subscribe to markets
+        # One channel with a ticker list, not one channel string per ticker
         subscribe_msg = {
             "id": int(time.time()),
             "cmd": "subscribe",
             "params": {
-                "channels": [f"orderbook_delta:{ticker}" for ticker in new_tickers]
+                "channels": ["orderbook_delta"],
+                "market_tickers": new_tickers,
             }
         }
 
         try:
-            await self._websocket.send(json.dumps(subscribe_msg))
+            await self._websocket.send(orjson.dumps(subscribe_msg).decode())
             self._subscribed_markets.update(new_tickers)
-            logger.info(f"Subscribed to {len(new_tickers)} markets: {', '.join(list(new_tickers)[:3])}{'...' if len(new_tickers) > 3 else ''}")
+            logger.info(
+                "Subscribed to %d markets: %s%s",
+                len(new_tickers),
+                ", ".join(itertools.islice(new_tickers, 3)),
+                "..." if len(new_tickers) > 3 else "",
+            )
         except Exception as e:
             logger.error(f"Failed to subscribe to markets: {e}")
 
@@ -146,10 +183,10 @@ class KalshiWebSocketClient:
         if not self._session:
             raise RuntimeError("Session not initialized")
 
-        # Create JWT payload
-        import jwt
-        from cryptography.hazmat.primitives import serialization
+        if jwt is None or serialization is None:
+            raise RuntimeError("PyJWT and cryptography are required for Kalshi authentication")
 
+        # Create JWT payload
         now = int(time.time())
         payload = {
             "sub": self.api_key,
@@ -158,14 +195,15 @@ class KalshiWebSocketClient:
             "aud": ["kalshi-api"]
         }
 
-        # Load private key
-        private_key = serialization.load_pem_private_key(
-            self.private_key.encode(),
-            password=None
-        )
+        # Load private key once; re-auth reuses the parsed key
+        if self._signing_key is None:
+            self._signing_key = serialization.load_pem_private_key(
+                self.private_key.encode(),
+                password=None
+            )
 
         # Sign JWT
-        token = jwt.encode(payload, private_key, algorithm="RS256")
+        token = jwt.encode(payload, self._signing_key, algorithm="RS256")
 
         # Exchange JWT for access token
         async with self._session.post(
@@ -190,9 +228,11 @@ class KalshiWebSocketClient:
             self.ws_url,
             extra_headers=headers,
             ping_interval=20,
-            ping_timeout=10
+            ping_timeout=10,
+            compression=None,  # small JSON deltas: inflating each costs more than it saves
         )
 
+        self._ready.set()
         logger.info("Connected to Kalshi WebSocket")
 
     async def _listen_loop(self) -> None:
@@ -202,46 +242,47 @@ class KalshiWebSocketClient:
 
         async for message in self._websocket:
             try:
-                data = json.loads(message)
-                await self._handle_message(data)
-            except json.JSONDecodeError:
+                data = orjson.loads(message)
+                self._handle_message(data)
+            except orjson.JSONDecodeError:
                 logger.warning(f"Invalid JSON received: {message}")
             except Exception as e:
                 logger.error(f"Error handling message: {e}")
 
-    async def _handle_message(self, data: dict) -> None:
-        """Handle incoming WebSocket messages."""
-        msg_type = data.get("type")
-
-        if msg_type == "orderbook_delta":
-            # Handle price update
-            ticker = data.get("ticker")
-            market_data = data.get("msg", {})
-
-            # Extract current price from orderbook
-            yes_ask = market_data.get("yes_ask")
-            yes_bid = market_data.get("yes_bid")
+    def _handle_message(self, data: dict) -> None:
+        """Route an incoming WebSocket message to its handler."""
+        handler = self._dispatch.get(data.get("type"))
+        if handler is not None:
+            handler(data)
+
+    def _on_orderbook_delta(self, data: dict) -> None:
+        """Handle a price update: mid of the yes book, or the one side present."""
+        callback = self._on_price_update
+        ticker = data.get("ticker")
+        if callback is None or not ticker:
+            return
 
-            if ticker and (yes_ask is not None or yes_bid is not None):
-                # Use mid price or best available price
-                if yes_ask is not None and yes_bid is not None:
-                    price = (float(yes_ask) + float(yes_bid)) / 2
-                elif yes_ask is not None:
-                    price = float(yes_ask)
-                elif yes_bid is not None:
-                    price = float(yes_bid)
-                else:
-                    return
+        # Kalshi quotes are integer cents; prices here are 0.0-1.0
+        market_data = data.get("msg") or {}
+        yes_bid = market_data.get("yes_bid")
+        yes_ask = market_data.get("yes_ask")
+        if yes_bid is None:
+            if yes_ask is None:
+                return
+            price = yes_ask * 0.01
+        elif yes_ask is None:
+            price = yes_bid * 0.01
+        else:
+            price = (yes_bid + yes_ask) * 0.005
 
-                if self._on_price_update:
-                    self._on_price_update(ticker, price)
+        callback(ticker, price)
 
-        elif msg_type == "error":
-            error_msg = data.get("msg", "Unknown error")
-            logger.error(f"WebSocket error from Kalshi: {error_msg}")
+    def _on_ws_error(self, data: dict) -> None:
+        error_msg = data.get("msg", "Unknown error")
+        logger.error(f"WebSocket error from Kalshi: {error_msg}")
 
-        elif msg_type in ("subscribed", "unsubscribed"):
-            logger.debug(f"Subscription {msg_type}: {data.get('msg')}")
+    def _on_sub_ack(self, data: dict) -> None:
+        logger.debug(f"Subscription {data.get('type')}: {data.get('msg')}")
 
 
 class LiveMarketManager:
@@ -249,14 +290,21 @@ class LiveMarketManager:
     Manages live market data updates using Kalshi WebSocket feed.
 
     Integrates with existing MarketConfig objects to update prices in real-time.
+    Orderbook deltas are coalesced per ticker (last write wins) and applied
+    once per `flush_interval`, so a burst of deltas costs one callback.
+    With a falsy `flush_interval` (0/None) every delta is applied directly,
+    for callers that already coalesce downstream.
     """
 
-    def __init__(self, api_key: str, private_key: str):
+    def __init__(self, api_key: str, private_key: str, flush_interval: float | None = 0.05):
         self.api_key = api_key
         self.private_key = private_key
+        self.flush_interval = flush_interval
         self._markets: dict[str, MarketConfig] = {}
         self._ws_client: KalshiWebSocketClient | None = None
         self._price_update_callback: Callable[[str, float], None] | None = None
+        self._pending: dict[str, float] = {}
+        self._flush_task: asyncio.Task | None = None
 
     async def __aenter__(self):
         self._ws_client = KalshiWebSocketClient(self.api_key, self.private_key)
@@ -285,32 +333,57 @@ class LiveMarketManager:
         for market in markets:
             self._markets[market.address] = market
 
+        if self.flush_interval and (self._flush_task is None or self._flush_task.done()):
+            self._flush_task = asyncio.create_task(self._flusher())
+
         # Connect WebSocket
         asyncio.create_task(self._ws_client.connect())
 
-        # Subscribe to markets
+        # Subscribe to markets as soon as the socket is up
         tickers = [m.address for m in markets]
-        await asyncio.sleep(1)  # Wait for connection
+        if not await self._ws_client.wait_until_connected(timeout=10.0):
+            logger.warning("Kalshi WebSocket not connected after 10s - skipping subscribe")
+            return
         await self._ws_client.subscribe_to_markets(tickers)
 
         logger.info(f"Started live price updates for {len(markets)} markets")
 
     async def stop(self) -> None:
         """Stop live price updates."""
+        if self._flush_task:
+            self._flush_task.cancel()
+            self._flush_task = None
         if self._ws_client:
             await self._ws_client.disconnect()
 
     def _handle_price_update(self, ticker: str, price: float) -> None:
-        """Handle price update from WebSocket."""
-        if ticker in self._markets:
-            market = self._markets[ticker]
-            old_price = market.current_probability
-            market.current_probability = price
-
-            logger.debug(f"Price update {ticker}: {old_price:.3f} → {price:.3f}")
-
+        """Handle price update from WebSocket: record it for the next flush."""
+        if ticker not in self._markets:
+            return
+        if self.flush_interval:
+            self._pending[ticker] = price
+        else:
+            self._apply(ticker, price)
+
+    async def _flusher(self) -> None:
+        """Apply coalesced price updates every flush_interval seconds."""
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            if not self._pending:
+                continue
+            pending, self._pending = self._pending, {}
+            for ticker, price in pending.items():
+                self._apply(ticker, price)
+
+    def _apply(self, ticker: str, price: float) -> None:
+        """Notify the callback and store the new price on the market."""
+        try:
+            # Callback first, so it can still read the old price
             if self._price_update_callback:
                 self._price_update_callback(ticker, price)
+            self._markets[ticker].current_probability = price
+        except Exception as e:
+            logger.warning(f"Price update failed for {ticker}: {e}")
 
     def _handle_error(self, error: Exception) -> None:
         """Handle WebSocket errors."""
@@ -11,14 +11,23 @@ Usage:
 from __future__ import annotations
 
 import asyncio
+import bisect
+import functools
+import inspect
+import math
+import os
 import random
-import uuid
 from datetime import datetime, timezone
+from typing import Any
 
 from news_streamer.models.news import RawNewsItem, SourceType
 from agents.schemas import Decision, MarketConfig, StoryPayload
 
-HEADLINES: list[tuple[str, str, tuple[str, ...]]] = [
+# Bound method of the shared module RNG, looked up once (random.seed()
+# still applies to it). The feed draws from its own random.Random instead.
+_random = random.random
+
+HEADLINES: tuple[tuple[str, str, tuple[str, ...]], ...] = (
     # (headline, body, pre_tagged_categories)
     # ── Politics ──────────────────────────────────────────────────
     ("US deploys additional carrier strike group to Persian Gulf amid rising tensions with Iran",
@@ -158,7 +167,7 @@ HEADLINES: list[tuple[str, str, tuple[str, ...]]] = [
      "The tour grossed $2.07B across 149 shows in 5 continents, surpassing Elton John's Farewell Tour record. Average ticket price was $456. Swift announced 12 additional stadium dates for 2026.", ("culture",)),
     ("Disney+ reports first profitable quarter, subscriber growth accelerates",
      "The streaming platform posted $47M in operating income on 174M subscribers, up 12M QoQ. Ad-supported tier now represents 38% of new sign-ups. Content spending was flat at $4.5B.", ("culture",)),
-]
+)
 
 _SOURCES = {
     "Reuters": {
@@ -197,34 +206,117 @@ _SOURCES = {
         "avatar": "https://logo.clearbit.com/ft.com",
     },
 }
-SOURCES = list(_SOURCES.keys())
-MOCK_SOURCE_TYPES = [SourceType.TWITTER, SourceType.TELEGRAM, SourceType.RSS, SourceType.NEWS_WIRE]
-
-
-def _make_item(headline: str, body: str, categories: tuple[str, ...]) -> RawNewsItem:
-    source = random.choice(SOURCES)
-    info = _SOURCES[source]
-    return RawNewsItem(
-        id=uuid.uuid4().hex[:12],
-        timestamp=datetime.now(timezone.utc),
-        headline=headline,
-        body=body,
-        source_type=random.choice(MOCK_SOURCE_TYPES),
-        source_handle=source,
-        source_description=info["desc"],
-        source_url=info["url"],
-        source_avatar=info["avatar"],
-        media_url="",
-        pre_tagged_tickers=(),
-        ticker_reasons=(),
-        pre_tagged_categories=categories,
-        pre_highlighted_keywords=(),
-        is_priority=random.random() < 0.3,
-        is_narrative=False,
-        urgency_tags=("HOT",) if random.random() < 0.15 else (),
-        economic_event_type="",
-        raw_data={},
-    )
+SOURCES = tuple(_SOURCES)
+MOCK_SOURCE_TYPES = (SourceType.TWITTER, SourceType.TELEGRAM, SourceType.RSS, SourceType.NEWS_WIRE)
+
+
+# Item ids are 12 hex chars (6 random bytes), sliced from one urandom block
+_ID_BYTES = 6
+_id_buf = b""
+_id_pos = 0
+
+
+def _next_id() -> str:
+    global _id_buf, _id_pos
+    if _id_pos + _ID_BYTES > len(_id_buf):
+        _id_buf = os.urandom(4096 - 4096 % _ID_BYTES)
+        _id_pos = 0
+    start = _id_pos
+    _id_pos = start + _ID_BYTES
+    return _id_buf[start:_id_pos].hex()
+
+
+def _seeded_ids(rng: random.Random):
+    """Reproducible 12-hex-char ids drawn from a seeded feed RNG."""
+    bits = rng.getrandbits
+    while True:
+        yield "%012x" % bits(48)
+
+
+# Per-item random attributes, rolled in batches of _ROLL_BATCH:
+# (source fields, source_type, is_priority, urgency_tags)
+_ROLL_BATCH = 256
+_HOT = ("HOT",)
+_Roll = tuple[dict[str, str], SourceType, bool, tuple[str, ...]]
+
+
+def _roll_stream(rng: random.Random):
+    n = _ROLL_BATCH
+    rand = rng.random
+    while True:
+        yield from zip(
+            rng.choices(_SOURCE_FIELDS, k=n),
+            rng.choices(MOCK_SOURCE_TYPES, k=n),
+            [rand() < 0.3 for _ in range(n)],
+            [_HOT if rand() < 0.15 else () for _ in range(n)],
+        )
+
+
+# Fields every mock item shares; per-item values are layered on top
+_ITEM_DEFAULTS = {
+    "media_url": "",
+    "pre_tagged_tickers": (),
+    "ticker_reasons": (),
+    "pre_highlighted_keywords": (),
+    "is_narrative": False,
+    "economic_event_type": "",
+}
+
+# Field templates prebuilt at import: one per headline (content + defaults)
+# and one per source, so an emit only fills in the rolled fields
+_TEMPLATES: tuple[dict, ...] = tuple(
+    {**_ITEM_DEFAULTS, "headline": h, "body": b, "pre_tagged_categories": c}
+    for h, b, c in HEADLINES
+)
+# Parallel to SOURCES; rolls pick a row directly, so no lookup by name
+_SOURCE_FIELDS: tuple[dict[str, str], ...] = tuple(
+    {
+        "source_handle": name,
+        "source_description": info["desc"],
+        "source_url": info["url"],
+        "source_avatar": info["avatar"],
+    }
+    for name, info in _SOURCES.items()
+)
+
+
+def _make_item(template: dict, ts: datetime, item_id: str, roll: _Roll) -> RawNewsItem:
+    """
+    Build a RawNewsItem from a headline template without running the
+    frozen dataclass __init__.
+
+    Mock values are trusted (non-empty id and headline, tz-aware ts), so
+    validation is skipped and the fields are written straight into the
+    instance dict instead of through one object.__setattr__ per field.
+    """
+    source_fields, source_type, is_priority, urgency = roll
+    item = object.__new__(RawNewsItem)
+    fields = item.__dict__
+    fields.update(template)
+    fields.update(source_fields)
+    # Plain item stores: no kwargs dict built per emit
+    fields["id"] = item_id
+    fields["timestamp"] = ts
+    fields["source_type"] = source_type
+    fields["is_priority"] = is_priority
+    fields["urgency_tags"] = urgency
+    fields["raw_data"] = {}
+    return item
+
+
+# Items emitted back to back (zero delay) share one timestamp for up to
+# this many items; any real wait between items forces a fresh stamp.
+_TS_REUSE = 16
+# Benchmark mode yields to the loop once per this many items
+_BENCH_YIELD = 64
+
+
+def _template_stream(rng: random.Random):
+    """Headline templates forever: each pass is a fresh shuffle of all of them."""
+    pool = list(_TEMPLATES)
+    while True:
+        rng.shuffle(pool)
+        yield from pool
 
 
 async def run_mock_feed(
@@ -232,31 +324,91 @@ async def run_mock_feed(
     *,
     interval_range: tuple[float, float] = (0.5, 3.0),
     shutdown: asyncio.Event | None = None,
+    seed: int | None = None,
+    benchmark: bool = False,
 ) -> None:
-    """Fire random headlines through the callback at realistic intervals."""
-    pool = list(HEADLINES)
-    random.shuffle(pool)
-    idx = 0
-
-    while shutdown is None or not shutdown.is_set():
-        headline, body, cats = pool[idx % len(pool)]
-        idx += 1
-        if idx >= len(pool):
-            random.shuffle(pool)
-            idx = 0
-
-        item = _make_item(headline, body, cats)
-        await callback(item)
-
-        delay = random.uniform(*interval_range)
-        try:
-            if shutdown:
-                await asyncio.wait_for(shutdown.wait(), timeout=delay)
-                break
+    """
+    Fire random headlines through the callback at realistic intervals.
+
+    With `benchmark=True` the feed runs flat out for throughput profiling
+    of the callback: `interval_range` is ignored, each item is handed to
+    the callback inline (awaited if async), and the loop only checks
+    `shutdown` and yields every _BENCH_YIELD items.
+
+    The feed draws from its own random.Random. With `seed` set, the whole
+    stream (order, sources, flags, ids, delays) replays identically;
+    timestamps are still wall-clock.
+
+    Pacing never waits on the callback. A sync callback is handed to the
+    loop with call_soon; an async one is fed from a queue by a consumer
+    task, so a slow callback delays delivery but not the emit schedule.
+    If the async callback raises, the feed stops and re-raises it.
+    """
+    loop = asyncio.get_running_loop()
+    rng = random.Random(seed)
+    next_template = _template_stream(rng).__next__
+    next_roll = _roll_stream(rng).__next__
+    next_id = _next_id if seed is None else _seeded_ids(rng).__next__
+    uniform = rng.uniform
+
+    if benchmark:
+        is_async = inspect.iscoroutinefunction(callback)
+        n = 0
+        while shutdown is None or not shutdown.is_set():
+            if n % _TS_REUSE == 0:
+                ts = datetime.now(timezone.utc)
+            item = _make_item(next_template(), ts, next_id(), next_roll())
+            if is_async:
+                await callback(item)
             else:
+                callback(item)
+            n += 1
+            if n % _BENCH_YIELD == 0:
+                await asyncio.sleep(0)
+        return
+
+    consumer: asyncio.Task | None = None
+    if inspect.iscoroutinefunction(callback):
+        queue: asyncio.Queue[RawNewsItem] = asyncio.Queue()
+
+        async def _consume() -> None:
+            get = queue.get
+            while True:
+                await callback(await get())
+
+        consumer = asyncio.create_task(_consume())
+        emit = queue.put_nowait
+    else:
+        emit = functools.partial(loop.call_soon, callback)
+
+    ts = None
+    stamped = 0
+
+    # One long-lived waiter on the shutdown event, raced against each delay
+    # by asyncio.wait (which returns on timeout instead of raising)
+    stop = asyncio.ensure_future(shutdown.wait()) if shutdown else None
+    try:
+        while stop is None or not stop.done():
+            if consumer is not None and consumer.done():
+                consumer.result()  # surface the callback's exception
+            if ts is None or stamped >= _TS_REUSE:
+                ts = datetime.now(timezone.utc)
+                stamped = 0
+            stamped += 1
+            emit(_make_item(next_template(), ts, next_id(), next_roll()))
+
+            delay = uniform(*interval_range)
+            if delay > 0:
+                ts = None
+            if stop is None:
                 await asyncio.sleep(delay)
-        except asyncio.TimeoutError:
-            pass
+            else:
+                await asyncio.wait((stop,), timeout=delay)
+    finally:
+        if stop is not None:
+            stop.cancel()
+        if consumer is not None:
+            consumer.cancel()
 
 
 # ---------------------------------------------------------------------------
@@ -264,62 +416,124 @@ async def run_mock_feed(
 # ---------------------------------------------------------------------------
 
 MOCK_REASONING = {
-    "YES": [
+    "YES": (
         "Direct positive signal for this market",
         "Strong correlation with market thesis",
         "Breaking event supports YES outcome",
         "Historical precedent favors YES",
         "Multiple confirming indicators",
         "Market-moving event, high confidence YES",
-    ],
-    "NO": [
+    ),
+    "NO": (
         "News contradicts market thesis",
         "Negative signal for YES outcome",
         "Counter-evidence to current probability",
         "Event reduces likelihood of YES resolution",
         "Bearish indicator for this market",
-    ],
-    "SKIP": [
+    ),
+    "SKIP": (
         "Irrelevant to this market",
         "No material impact on outcome",
         "Tangentially related, insufficient signal",
         "Noise — no actionable information",
         "Outside scope of market question",
-    ],
+    ),
 }
 
 
-async def mock_evaluate(story: StoryPayload, market: MarketConfig) -> Decision:
+# Action table, picked by bisecting a roll on the cumulative thresholds:
+# (action, theo shift low + span, theo clamp, reasoning choices)
+_ACTION_CUTOFFS = (0.35, 0.65)  # YES below 0.35, NO below 0.65, else SKIP
+_ACTIONS = (
+    ("YES", 0.05, 0.20, -math.inf, 0.99, MOCK_REASONING["YES"]),
+    ("NO", -0.25, 0.20, 0.01, math.inf, MOCK_REASONING["NO"]),
+    ("SKIP", -0.02, 0.04, 0.0, 1.0, MOCK_REASONING["SKIP"]),
+)
+
+
+# Simulated latencies are quantized to 10ms buckets that share one timer
+# handle, so N concurrent evaluations schedule ~N/bucket timers, not N.
+_BUCKET_S = 0.01
+_buckets: dict[tuple[asyncio.AbstractEventLoop, int], list[tuple[asyncio.Future, Any]]] = {}
+
+
+def _release_bucket(key: tuple[asyncio.AbstractEventLoop, int]) -> None:
+    for fut, result in _buckets.pop(key, ()):
+        if not fut.done():
+            fut.set_result(result)
+
+
+def _sleep_bucketed(delay: float, result: Any = None) -> asyncio.Future:
+    """Future resolved with `result` at most one bucket (10ms) after `delay` seconds."""
+    loop = asyncio.get_running_loop()
+    tick = math.ceil((loop.time() + delay) / _BUCKET_S)
+    key = (loop, tick)
+    waiters = _buckets.get(key)
+    if waiters is None:
+        waiters = _buckets[key] = []
+        loop.call_at(tick * _BUCKET_S, _release_bucket, key)
+    fut = loop.create_future()
+    waiters.append((fut, result))
+    return fut
+
+
+def _mock_latency() -> float:
+    """Simulated Groq-like round-trip, 150-400ms."""
+    # Drawn pre-quantized to 0.1ms (integer tenths), so no round() later
+    return (1500 + int(2500 * _random())) / 10.0
+
+
+def _mock_decision(story: StoryPayload, market: MarketConfig, latency: float) -> Decision:
+    # Three raw random() draws (action, theo shift, reasoning) scaled inline,
+    # rather than going through random.uniform / random.choice
+    rand = _random
+    current_prob = market.current_probability
+    action, lo, span, floor, ceil, reasons = _ACTIONS[
+        bisect.bisect_right(_ACTION_CUTOFFS, rand())
+    ]
+    theo = round(min(ceil, max(floor, current_prob + lo + span * rand())), 3)
+
+    delta = abs(theo - current_prob)
+    confidence = round(min(delta * 2.0, 1.0), 3)
+    reasoning = reasons[int(rand() * len(reasons))]
+
+    # Every value above is in range by construction (theo clamped to
+    # [0, 1], confidence capped at 1), so skip Decision's __init__ and
+    # validation and fill the frozen instance's dict directly
+    decision = object.__new__(Decision)
+    fields = decision.__dict__
+    fields["action"] = action
+    fields["confidence"] = confidence
+    fields["reasoning"] = reasoning
+    fields["market_address"] = market.address
+    fields["story_id"] = story.id
+    fields["latency_ms"] = latency
+    fields["prompt_version"] = "mock"
+    fields["theo"] = theo
+    return decision
+
+
+# Both evaluators are plain functions returning a timer-resolved future:
+# the decision is built up front and handed back after the simulated
+# latency, with no coroutine frame per call. Callers still await them.
+
+def mock_evaluate(story: StoryPayload, market: MarketConfig) -> asyncio.Future[Decision]:
     """
     Drop-in replacement for _modal_evaluate. Returns a random decision
     with simulated Groq-like latency (150–400ms).
     """
-    latency = random.uniform(150, 400)
-    await asyncio.sleep(latency / 1000)
+    latency = _mock_latency()
+    return _sleep_bucketed(latency / 1000, _mock_decision(story, market, latency))
 
-    current_prob = market.current_probability
-    roll = random.random()
-    if roll < 0.35:
-        action = "YES"
-        theo = round(min(0.99, current_prob + random.uniform(0.05, 0.25)), 3)
-    elif roll < 0.65:
-        action = "NO"
-        theo = round(max(0.01, current_prob - random.uniform(0.05, 0.25)), 3)
-    else:
-        action = "SKIP"
-        theo = round(current_prob + random.uniform(-0.02, 0.02), 3)
 
-    delta = abs(theo - current_prob)
-    confidence = round(min(delta * 2.0, 1.0), 3)
-    reasoning = random.choice(MOCK_REASONING[action])
-
-    return Decision(
-        action=action,
-        confidence=confidence,
-        reasoning=reasoning,
-        market_address=market.address,
-        story_id=story.id,
-        latency_ms=round(latency, 1),
-        prompt_version="mock",
-        theo=theo,
+def mock_evaluate_batch(
+    story: StoryPayload, markets: list[MarketConfig]
+) -> asyncio.Future[list[Decision]]:
+    """
+    Batched mock_evaluate: one simulated round-trip for the whole batch,
+    returning one random decision per market in input order.
+    """
+    latency = _mock_latency()
+    return _sleep_bucketed(
+        latency / 1000, [_mock_decision(story, m, latency) for m in markets]
     )
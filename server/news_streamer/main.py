@@ -37,7 +37,7 @@ async def main() -> None:
     """
     from news_streamer.config import settings
     from news_streamer.dbnews_client import DBNewsWebSocketClient
-    from news_streamer.models import RawNewsItem
+    from news_streamer.models import RawNewsItem, TaggedNewsItem
     from news_streamer.ws_server import NewsWebSocketServer
     from news_streamer.tagger import NewsTagger
     from news_streamer.pubsub import NewsPublisher
@@ -58,6 +58,33 @@ async def main() -> None:
     news_publisher = NewsPublisher(settings.redis.url)
     await news_publisher.connect()
 
+    # Redis publishes are queued and flushed by a single background task,
+    # so a Redis round-trip never blocks handling of the next headline.
+    # A None in the queue tells the flusher to publish what it has and exit.
+    publish_queue: asyncio.Queue[TaggedNewsItem | None] = asyncio.Queue()
+
+    async def publish_flusher() -> None:
+        stopping = False
+        while not stopping:
+            item = await publish_queue.get()
+            if item is None:
+                return
+            batch = [item]
+            # Everything that arrived while the last batch was in flight
+            while not publish_queue.empty() and len(batch) < 256:
+                item = publish_queue.get_nowait()
+                if item is None:
+                    stopping = True
+                    break
+                batch.append(item)
+            try:
+                await news_publisher.publish_batch(batch)
+            except Exception as e:
+                logger.error(
+                    f"Failed to publish batch to Redis: {e}",
+                    extra={"batch_size": len(batch), "error": str(e)},
+                )
+
     # Message counter for stats
     message_count = 0
 
@@ -111,13 +138,7 @@ async def main() -> None:
             )
 
         if tagged_news is not None:
-            try:
-                await news_publisher.publish(tagged_news)
-            except Exception as e:
-                logger.error(
-                    f"Failed to publish to Redis: {e}",
-                    extra={"news_id": news.id, "error": str(e)},
-                )
+            publish_queue.put_nowait(tagged_news)
 
     async def handle_error(error: Exception) -> None:
         logger.error(
@@ -136,6 +157,8 @@ async def main() -> None:
     # Start WebSocket server for clients
     await ws_server.start()
 
+    flusher_task = asyncio.create_task(publish_flusher())
+
     # Connect to DBNews
     await dbnews_client.connect()
 
@@ -161,7 +184,24 @@ async def main() -> None:
         # Disconnect from DBNews
         await dbnews_client.disconnect()
 
-        # Close Redis publisher
+        # Stop the publish flusher via sentinel, so its in-flight batch and
+        # everything queued ahead of the sentinel still get published
+        publish_queue.put_nowait(None)
+        await flusher_task
+        # Anything that slipped in behind the sentinel
+        remaining = []
+        while not publish_queue.empty():
+            item = publish_queue.get_nowait()
+            if item is not None:
+                remaining.append(item)
+        if remaining:
+            try:
+                await news_publisher.publish_batch(remaining)
+            except Exception as e:
+                logger.error(
+                    f"Failed to publish final batch to Redis: {e}",
+                    extra={"batch_size": len(remaining), "error": str(e)},
+                )
         await news_publisher.close()
 
         # Log final stats
@@ -186,4 +226,10 @@ if __name__ == "__main__":
     except SystemExit:
         raise SystemExit(1)
 
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+
     asyncio.run(main())
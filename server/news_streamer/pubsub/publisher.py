@@ -10,6 +10,7 @@ Usage:
     publisher = NewsPublisher(redis_url="redis://localhost:6379/0")
     await publisher.connect()
     await publisher.publish(tagged_item)
+    await publisher.publish_batch([item_a, item_b])  # in order, one await
     await publisher.close()
 
 Context manager usage:
@@ -19,6 +20,7 @@ Context manager usage:
 from __future__ import annotations
 
 import logging
+from typing import Sequence
 
 from pub_sub_feed import FeedPublisher, PublisherError  # re-export for callers
 
@@ -72,3 +74,20 @@ class NewsPublisher:
             total,
         )
         return total
+
+    async def publish_batch(self, items: Sequence[TaggedNewsItem]) -> int:
+        """
+        Publish several tagged items one after another, in arrival order, so
+        subscribers see headlines in the order they came in and the pooled
+        Redis client never sees a burst of concurrent connections.
+
+        A failure on one item is logged and does not abort the rest.
+        Returns the total subscriber delivery count across all items.
+        """
+        total = 0
+        for item in items:
+            try:
+                total += await self.publish(item)
+            except Exception as e:
+                logger.error("NewsPublisher: item %s failed to publish: %s", item.id, e)
+        return total
@@ -8,12 +8,13 @@ from __future__ import annotations
 
 import asyncio
 import base64
-import json
 import logging
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Any, Optional, Set
 
+import orjson
+
 # JWT import is conditional - only needed if authentication is configured
 try:
     import jwt
@@ -23,6 +24,10 @@ except ImportError:
     jwt = None
 import websockets
 from websockets.server import WebSocketServerProtocol, serve
+# Fan-out helper matching the legacy protocol objects serve() hands out
+# (on websockets>=14, top-level websockets.broadcast only accepts the new
+# asyncio connections)
+from websockets.legacy.protocol import broadcast as _broadcast
 
 from news_streamer.config import settings
 from news_streamer.models import RawNewsItem, TaggedNewsItem
@@ -191,6 +196,19 @@ class ServerStats:
     start_time: datetime
 
 
+_PONG_FRAME = orjson.dumps({"type": "pong"}).decode()
+
+# Per-connection transport settings. Frames are small JSON objects fanned out
+# to many clients, so per-message-deflate costs more CPU and memory than it
+# saves; inbound frames are only pings and commands, so cap their size and
+# the receive queue to bound per-connection buffers.
+_SERVE_LIMITS: dict[str, Any] = {
+    "compression": None,
+    "max_size": 2**16,
+    "max_queue": 32,
+}
+
+
 class NewsWebSocketServer:
     """
     WebSocket server that broadcasts news to connected clients.
@@ -274,6 +292,7 @@ class NewsWebSocketServer:
                 self._port,
                 ping_interval=30,
                 ping_timeout=10,
+                **_SERVE_LIMITS,
                 process_request=self._authenticate,
                 subprotocols=["authorization"],
             )
@@ -287,6 +306,7 @@ class NewsWebSocketServer:
                 self._port,
                 ping_interval=30,
                 ping_timeout=10,
+                **_SERVE_LIMITS,
             )
             logger.info(
                 f"WebSocket server started on ws://{self._host}:{self._port} (no auth - streaming mode)"
@@ -323,23 +343,21 @@ class NewsWebSocketServer:
         if self._welcome_extra:
             welcome.update(self._welcome_extra)
         try:
-            await websocket.send(json.dumps(welcome))
+            await websocket.send(orjson.dumps(welcome).decode())
         except Exception as e:
             logger.warning(f"Failed to send welcome: {e}")
 
         try:
             async for message in websocket:
                 try:
-                    data = json.loads(message)
+                    data = orjson.loads(message)
                     msg_type = data.get("type", "")
 
                     if msg_type == "ping":
-                        await websocket.send(
-                            json.dumps({"type": "pong"})
-                        )
+                        await websocket.send(_PONG_FRAME)
                     elif msg_type == "toggle_market" and self._on_command:
                         await self._on_command(data)
-                except json.JSONDecodeError:
+                except orjson.JSONDecodeError:
                     pass
 
         except websockets.ConnectionClosed:
@@ -355,37 +373,26 @@ class NewsWebSocketServer:
 
     async def broadcast_json(self, payload: dict[str, Any]) -> int:
         """Broadcast an arbitrary JSON message to all connected clients."""
+        return await self._fan_out(orjson.dumps(payload))
+
+    def broadcast_bytes(self, frame: bytes) -> int:
+        """
+        Write a pre-serialized JSON frame to every connected client.
+
+        Synchronous and fire-and-forget: the frame is decoded once and handed
+        to the legacy broadcast(), which writes it to each transport without
+        awaiting per-client drains. Frames go out as text so browser clients
+        can JSON.parse them unchanged. Returns the number of clients targeted.
+        """
         if not self._clients:
             return 0
-        message = json.dumps(payload)
-        async with self._lock:
-            clients = list(self._clients)
-        if not clients:
-            return 0
-        results = await asyncio.gather(
-            *[self._send_to_client(c, message) for c in clients],
-            return_exceptions=True,
-        )
-        return sum(1 for r in results if r is True)
+        _broadcast(self._clients, frame.decode())
+        self._messages_broadcast += 1
+        return len(self._clients)
 
     async def broadcast_decision(self, data: dict[str, Any]) -> int:
         """Broadcast an agent decision to all connected clients."""
-        if not self._clients:
-            return 0
-
-        message = json.dumps({"type": "decision", "data": data})
-
-        async with self._lock:
-            clients = list(self._clients)
-
-        if not clients:
-            return 0
-
-        results = await asyncio.gather(
-            *[self._send_to_client(client, message) for client in clients],
-            return_exceptions=True,
-        )
-        return sum(1 for r in results if r is True)
+        return await self._fan_out(orjson.dumps({"type": "decision", "data": data}))
 
     async def broadcast(
         self,
@@ -396,7 +403,9 @@ class NewsWebSocketServer:
         Broadcast a news item to all connected clients.
 
         If tagged is provided, includes sentiment analysis in the broadcast.
-        Returns the number of clients that received the message.
+        The message is encoded once and written to every client without
+        awaiting each send; connections that are closing are skipped.
+        Returns the number of clients the message was written to.
         """
         if not self._clients:
             return 0
@@ -407,35 +416,32 @@ class NewsWebSocketServer:
         else:
             data = _serialize_raw_news_item(news)
 
-        message = json.dumps({
+        return await self._fan_out(orjson.dumps({
             "type": "news",
             "data": data,
-        })
+        }))
+
+    async def _fan_out(self, frame: bytes) -> int:
+        """
+        Send a frame via broadcast_bytes, falling back to awaiting one send
+        per client if the fire-and-forget broadcast raises.
+        """
+        try:
+            return self.broadcast_bytes(frame)
+        except Exception as e:
+            logger.warning(f"Broadcast failed, sending per client: {e}")
 
-        # Get snapshot of clients to avoid modification during iteration
+        message = frame.decode()
         async with self._lock:
             clients = list(self._clients)
-
         if not clients:
             return 0
-
-        # Send to all clients concurrently
         results = await asyncio.gather(
             *[self._send_to_client(client, message) for client in clients],
             return_exceptions=True,
         )
-
-        success_count = sum(1 for r in results if r is True)
         self._messages_broadcast += 1
-
-        if success_count < len(clients):
-            failed = len(clients) - success_count
-            logger.debug(
-                f"Broadcast: {success_count}/{len(clients)} clients "
-                f"({failed} failed)"
-            )
-
-        return success_count
+        return sum(1 for r in results if r is True)
 
     async def _send_to_client(
         self, client: WebSocketServerProtocol, message: str
@@ -25,10 +25,12 @@ class PubSub:
     """
     In-memory async pub/sub with per-channel subscriber lists.
 
-    - subscribe/unsubscribe are O(1) dict ops.
+    - subscribe/unsubscribe are dict ops plus a scan of one channel's list;
+      subscribing the same callback twice to a channel is a no-op.
     - publish fans out to the union of subscribers across all given channels,
       deduped so each callback fires at most once per publish.
-    - Callbacks are fired as concurrent tasks (non-blocking).
+    - Callbacks are fired as concurrent tasks (non-blocking); a failing
+      callback is logged without affecting the others.
     """
 
     __slots__ = ("_subs",)
@@ -37,7 +39,9 @@ class PubSub:
         self._subs: dict[str, list[Callback]] = defaultdict(list)
 
     def subscribe(self, channel: str, cb: Callback) -> None:
-        self._subs[channel].append(cb)
+        subs = self._subs[channel]
+        if cb not in subs:
+            subs.append(cb)
 
     def unsubscribe(self, channel: str, cb: Callback) -> None:
         try:
@@ -54,21 +58,26 @@ class PubSub:
         Each callback is invoked at most once even if it appears on multiple
         channels. Returns the number of unique callbacks fired.
         """
-        seen: set[int] = set()
-        tasks: list[asyncio.Task] = []
-
-        for ch in channels:
-            for cb in self._subs.get(ch, ()):
-                cb_id = id(cb)
-                if cb_id in seen:
-                    continue
-                seen.add(cb_id)
-                tasks.append(asyncio.create_task(cb(payload)))
-
-        if tasks:
-            await asyncio.gather(*tasks, return_exceptions=True)
-
-        return len(tasks)
+        subs = self._subs
+        if len(channels) == 1:
+            # Single-tag story: a channel never holds the same callback twice
+            targets = tuple(subs.get(channels[0], ()))
+        else:
+            # dict.fromkeys dedupes in C while keeping subscription order
+            targets = dict.fromkeys(
+                cb for ch in channels if ch in subs for cb in subs[ch]
+            )
+        if not targets:
+            return 0
+
+        results = await asyncio.gather(
+            *[cb(payload) for cb in targets], return_exceptions=True,
+        )
+        for cb, r in zip(targets, results):
+            if isinstance(r, BaseException):
+                logger.warning(f"Subscriber {getattr(cb, '__qualname__', cb)} failed: {r!r}")
+
+        return len(results)
 
     @property
     def channel_count(self) -> int: